@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """deep-research — Query multiple deep research models in parallel.
 
-@decision ThreadPoolExecutor with max_workers=3 for parallel provider calls —
-each provider is I/O-bound (network polling), so threads are ideal. Results
+@decision ThreadPoolExecutor with one worker per active provider for parallel
+provider calls — each provider is I/O-bound (network polling), so threads are
+ideal and wall time is max(provider_time) rather than the sum. Results
 collected via as_completed for progressive stderr output. JSON to stdout for
 Claude consumption; compact mode for human debugging. Timeout default raised to
 1800s (30 min) to accommodate provider ceilings. as_completed buffer increased
@@ -32,7 +33,7 @@ SCRIPT_DIR = Path(__file__).parent.resolve()
 sys.path.insert(0, str(SCRIPT_DIR))
 
 from lib import env, http
-from lib.render import ProviderResult, render_json, render_compact
+from lib.render import ProviderResult, render_compact, write_json
 from lib import openai_dr, perplexity_dr, gemini_dr
 from lib.errors import ProviderError
 from lib.validate import validate_citations
@@ -171,7 +172,7 @@ def main():
 
     if args.debug:
         os.environ["DEEP_RESEARCH_DEBUG"] = "1"
-        http.DEBUG = True
+        http.set_debug(True)
 
     if not args.topic:
         print("Error: Please provide a topic to research.", file=sys.stderr)
@@ -212,7 +213,7 @@ def main():
         results = run_mock(available)
     else:
         results = []
-        with ThreadPoolExecutor(max_workers=3) as executor:
+        with ThreadPoolExecutor(max_workers=len(available)) as executor:
             futures = {}
             for provider in available:
                 api_key = config[PROVIDER_KEY_MAP[provider]]
@@ -259,7 +260,7 @@ def main():
 
         # Write raw_results.json (includes comparison_matrix key)
         with open(out / "raw_results.json", "w") as f:
-            f.write(render_json(results, args.topic, comparison_matrix=matrix_dict))
+            write_json(f, results, args.topic, comparison_matrix=matrix_dict)
 
         # Write comparison_matrix.json as a standalone file
         with open(out / "comparison_matrix.json", "w") as f:
@@ -310,7 +311,8 @@ def main():
                 elapsed = f" after {r.elapsed_seconds}s" if r.elapsed_seconds else ""
                 print(f"  - {r.provider}: {r.error or 'unknown error'}{elapsed}")
     elif args.emit == "json":
-        print(render_json(results, args.topic, comparison_matrix=matrix_dict))
+        write_json(sys.stdout, results, args.topic, comparison_matrix=matrix_dict)
+        sys.stdout.write("\n")
     else:
         print(render_compact(results, args.topic))
 
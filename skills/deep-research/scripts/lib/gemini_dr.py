@@ -21,14 +21,29 @@ existing SSE error handler converts to an HTTPError and the research() fallback
 catches to fall through to polling. ZOMBIE_THRESHOLD is retained for documentation but
 is no longer used in active code.
 
+DEC-SSE-RESUME-001: A dropped or silent SSE stream is reopened (up to SSE_MAX_RESUMES
+times) with Last-Event-ID before research() gives up on streaming, so a transient blip
+late in a long run costs one reconnect instead of a switch to full-body polling.
+
+DEC-POLL-AIMD-001: The polling fallback paces itself on observed progress, not just
+elapsed time. _PollController resets to the _get_poll_interval() baseline whenever the
+interaction's progress snapshot (status, output count, last output length) changes,
+and backs off multiplicatively (x1.5, capped at 60s) while it stays the same. Long
+silent "thinking" phases cost fewer requests; active output is still polled promptly.
+
 The Interactions API is a separate endpoint from the standard Gemini generateContent
 API. Uses v1beta API with API key auth (not OAuth).
 """
 
+import io
 import json
+import re
 import sys
 import time
-from typing import Any, Dict, List, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 
 from . import http
 from .errors import ProviderError, ProviderTimeoutError, ProviderRateLimitError, ProviderAPIError
@@ -36,8 +51,10 @@ from .errors import ProviderError, ProviderTimeoutError, ProviderRateLimitError,
 BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
 AGENT = "deep-research-pro-preview-12-2025"
 MAX_TIMEOUT_SECONDS = 1800  # 30 minutes total timeout
+MAX_INLINE_CITATIONS = 256  # Cap on citations scraped from report text
 ZOMBIE_THRESHOLD = 300  # 5 minutes — retained for reference, replaced by SSE_READ_TIMEOUT
 SSE_READ_TIMEOUT = 120  # Socket read timeout for SSE streams (DEC-TIMEOUT-007)
+SSE_MAX_RESUMES = 2  # Last-Event-ID reconnects before falling back to polling
 
 
 def _submit_request(api_key: str, topic: str) -> Dict[str, Any]:
@@ -66,6 +83,13 @@ def _submit_request(api_key: str, topic: str) -> Dict[str, Any]:
     )
 
 
+# Adaptive poll schedule: _POLL_INTERVALS[i] applies from _POLL_THRESHOLDS[i-1]
+# (inclusive) up to _POLL_THRESHOLDS[i] seconds elapsed. Extra tiers are added
+# here without touching _get_poll_interval().
+_POLL_THRESHOLDS = (120.0, 600.0)     # 2 min, 10 min
+_POLL_INTERVALS = (5.0, 15.0, 30.0)
+
+
 def _get_poll_interval(elapsed: float) -> float:
     """Calculate adaptive poll interval based on elapsed time.
 
@@ -75,19 +99,68 @@ def _get_poll_interval(elapsed: float) -> float:
     Returns:
         Poll interval in seconds (5s, 15s, or 30s)
     """
-    if elapsed < 120:  # First 2 minutes
-        return 5.0
-    elif elapsed < 600:  # Next 8 minutes (2-10 min)
-        return 15.0
-    else:  # After 10 minutes
-        return 30.0
+    return _POLL_INTERVALS[bisect_right(_POLL_THRESHOLDS, elapsed)]
+
+
+# Terminal interaction states, compared against the lowercased status so any
+# casing the API returns ("completed", "COMPLETED", "Completed") matches.
+_COMPLETED = frozenset({"completed"})
+_FAILED = frozenset({"failed"})
+_CANCELLED = frozenset({"cancelled"})
+
+
+def _interaction_status(resp: Dict[str, Any]) -> str:
+    """Return an interaction's status, from 'status' or 'metadata.status'."""
+    status = resp.get("status", resp.get("metadata", {}).get("status", ""))
+    return status if isinstance(status, str) else ""
+
+
+POLL_BACKOFF_FACTOR = 1.5
+POLL_MAX_INTERVAL = 60.0
+
+
+def _progress_snapshot(resp: Dict[str, Any], status: str) -> Tuple[str, int, int]:
+    """Summarize an interaction's progress as (status, output_count, last_output_len)."""
+    outputs = resp.get("outputs") or []
+    last_len = 0
+    if outputs:
+        last = outputs[-1]
+        if isinstance(last, dict):
+            text = last.get("text", last.get("content", ""))
+            last_len = len(text) if isinstance(text, str) else 0
+        elif isinstance(last, str):
+            last_len = len(last)
+    return status, len(outputs), last_len
+
+
+class _PollController:
+    """AIMD-style poll pacing (DEC-POLL-AIMD-001).
+
+    Unchanged progress multiplies the interval by POLL_BACKOFF_FACTOR up to
+    POLL_MAX_INTERVAL; any change resets it to the elapsed-time baseline.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[Tuple[str, int, int]] = None
+        self._interval: Optional[float] = None
+
+    def next_interval(self, elapsed: float, snapshot: Tuple[str, int, int]) -> float:
+        if self._interval is None or snapshot != self._snapshot:
+            self._snapshot = snapshot
+            self._interval = _get_poll_interval(elapsed)
+        else:
+            self._interval = min(self._interval * POLL_BACKOFF_FACTOR, POLL_MAX_INTERVAL)
+        return self._interval
 
 
 def _poll_response_fallback(api_key: str, interaction_id: str) -> Dict[str, Any]:
     """Poll for a completed interaction (fallback when streaming unavailable).
 
-    Uses adaptive polling: 5s for first 2 min, 15s for next 8 min, 30s after that.
-    Total timeout: 1800s (30 minutes).
+    Uses adaptive polling: 5s for first 2 min, 15s for next 8 min, 30s after that,
+    backing off up to 60s while the interaction shows no progress
+    (DEC-POLL-AIMD-001). Total timeout: 1800s (30 minutes). Polls are conditional GETs: when the
+    server supports ETags an unchanged interaction costs a bodiless 304 and the
+    previous response is reused.
 
     Returns:
         Completed interaction response dict.
@@ -98,6 +171,9 @@ def _poll_response_fallback(api_key: str, interaction_id: str) -> Dict[str, Any]
     headers = {"x-goog-api-key": api_key}
     start_time = time.time()
     poll_count = 0
+    etag: Optional[str] = None
+    resp: Dict[str, Any] = {}
+    pacing = _PollController()
 
     while True:
         elapsed = time.time() - start_time
@@ -105,33 +181,52 @@ def _poll_response_fallback(api_key: str, interaction_id: str) -> Dict[str, Any]
         if elapsed >= MAX_TIMEOUT_SECONDS:
             raise ProviderTimeoutError("gemini", MAX_TIMEOUT_SECONDS, elapsed)
 
-        resp = http.get(
+        fresh, etag = http.get_if_changed(
             f"{BASE_URL}/interactions/{interaction_id}",
+            etag=etag,
             headers=headers,
             timeout=30,
         )
-        status = resp.get("status", resp.get("metadata", {}).get("status", ""))
+        if fresh is not None:
+            resp = fresh
+        status = _interaction_status(resp)
         poll_count += 1
         http.log(f"Gemini poll {poll_count}: status={status} (elapsed={int(elapsed)}s)")
 
-        if status in ("completed", "COMPLETED"):
+        status_key = status.lower()
+        if status_key in _COMPLETED:
             return resp
-        elif status in ("failed", "FAILED"):
+        elif status_key in _FAILED:
             error = resp.get("error", {})
             msg = error.get("message", "Unknown error") if isinstance(error, dict) else str(error)
             raise ProviderAPIError("gemini", 0, msg, elapsed)
-        elif status in ("cancelled", "CANCELLED"):
+        elif status_key in _CANCELLED:
             raise ProviderAPIError("gemini", 0, "was cancelled", elapsed)
         else:
-            minutes = int(elapsed) // 60
-            seconds = int(elapsed) % 60
-            sys.stderr.write(f"  [Gemini] Status: {status} ({minutes}m {seconds:02d}s, poll {poll_count})\n")
+            sys.stderr.write(f"  [Gemini] Status: {status} ({_format_elapsed(elapsed)}, poll {poll_count})\n")
             sys.stderr.flush()
 
-            interval = _get_poll_interval(elapsed)
+            interval = pacing.next_interval(elapsed, _progress_snapshot(resp, status))
             time.sleep(interval)
 
 
+def _format_elapsed(elapsed: float) -> str:
+    """Format elapsed seconds as "Xm YYs" for progress lines."""
+    minutes, seconds = divmod(int(elapsed), 60)
+    return f"{minutes}m {seconds:02d}s"
+
+
+# Thinking summaries longer than this are cut to fit, ellipsis included.
+_SUMMARY_MAX_CHARS = 80
+_SUMMARY_CUT = _SUMMARY_MAX_CHARS - 3
+
+
+@lru_cache(maxsize=2048)
+def _thinking_prefix(seconds: int) -> str:
+    """Line prefix for a thinking summary; cached per whole second (2048 ~ 34 min)."""
+    return f"  [Gemini] {_format_elapsed(seconds)} - "
+
+
 def _format_thinking_line(elapsed: float, summary_text: str) -> str:
     """Format a thinking summary line for stderr output.
 
@@ -142,31 +237,44 @@ def _format_thinking_line(elapsed: float, summary_text: str) -> str:
     Returns:
         Formatted line like "  [Gemini] 2m 30s - Searching: \"topic\""
     """
-    minutes = int(elapsed) // 60
-    seconds = int(elapsed) % 60
+    if len(summary_text) > _SUMMARY_MAX_CHARS:
+        summary_text = summary_text[:_SUMMARY_CUT] + "..."
+    return _thinking_prefix(int(elapsed)) + summary_text
+
 
-    # Truncate summary to ~80 chars
-    max_len = 80
-    if len(summary_text) > max_len:
-        summary_text = summary_text[:max_len - 3] + "..."
+_JSON_DECODE = json.JSONDecoder().decode
 
-    return f"  [Gemini] {minutes}m {seconds:02d}s - {summary_text}"
+
+def _decode_event_data(data_str: str) -> Optional[Dict[str, Any]]:
+    """Decode an SSE event's JSON data, or None (logged) if it is malformed."""
+    if not data_str:
+        return {}
+    try:
+        return _JSON_DECODE(data_str)
+    except json.JSONDecodeError:
+        http.log(f"Failed to parse event data as JSON: {data_str[:100]}")
+        return None
 
 
-def _stream_response(api_key: str, interaction_id: str) -> str:
+def _stream_response(api_key: str, interaction_id: str) -> Tuple[str, Dict[str, Any]]:
     """Stream a Gemini interaction via SSE and return the final report.
 
     Processes SSE events:
     - interaction.start: log start
     - content.delta with thought_summary: display on stderr
     - content.delta with text: accumulate into report
-    - interaction.complete: return accumulated report
+    - interaction.complete: return accumulated report and the event's data
     - error: raise HTTPError
 
     Zombie detection via socket read_timeout (DEC-TIMEOUT-007): stream_sse() is called
     with read_timeout=SSE_READ_TIMEOUT (120s). If the server goes silent, readline()
-    raises TimeoutError after 120s, which stream_sse() converts to an HTTPError. The
-    caller (research()) catches that HTTPError and falls through to polling.
+    raises TimeoutError after 120s, which stream_sse() converts to an HTTPError.
+
+    Resume (DEC-SSE-RESUME-001): a dropped or silent stream (connection error or 5xx)
+    is reopened up to SSE_MAX_RESUMES times with Last-Event-ID set to the last event id
+    seen, so already-received deltas are not replayed. A reconnect without an id is
+    only attempted while no report text has been received; otherwise, or once resumes
+    are exhausted, the HTTPError propagates and research() falls through to polling.
 
     Overall timeout: MAX_TIMEOUT_SECONDS (1800s) total.
 
@@ -175,7 +283,8 @@ def _stream_response(api_key: str, interaction_id: str) -> str:
         interaction_id: Interaction ID from _submit_request
 
     Returns:
-        Complete report text
+        Tuple of (report_text, final_data) where final_data is the decoded
+        interaction.complete payload ({} if it carried none)
 
     Raises:
         http.HTTPError: On API error, timeout, or SSE silence timeout
@@ -188,89 +297,129 @@ def _stream_response(api_key: str, interaction_id: str) -> str:
 
     start_time = time.time()
     event_count = 0
-    report_parts: List[str] = []
-
-    try:
-        for event in http.stream_sse(
-            url,
-            headers=headers,
-            timeout=MAX_TIMEOUT_SECONDS,
-            read_timeout=SSE_READ_TIMEOUT,
-        ):
-            event_count += 1
-            elapsed = time.time() - start_time
-
-            # Overall timeout check
-            if elapsed >= MAX_TIMEOUT_SECONDS:
-                raise ProviderTimeoutError("gemini", MAX_TIMEOUT_SECONDS, elapsed)
-
-            event_type = event.get("event", "")
-            data_str = event.get("data", "")
+    # Reports arrive as thousands of small content.delta chunks; a single
+    # growable buffer avoids holding one str object per delta.
+    report_buf = io.StringIO()
+    last_event_id = ""
+    resumes = 0
 
-            # Parse JSON data if present
-            data: Dict[str, Any] = {}
-            if data_str:
-                try:
-                    data = json.loads(data_str)
-                except json.JSONDecodeError:
-                    http.log(f"Failed to parse event data as JSON: {data_str[:100]}")
-                    continue
+    while True:
+        stream_headers = dict(headers)
+        if last_event_id:
+            stream_headers["Last-Event-ID"] = last_event_id
 
-            http.log(f"SSE event: {event_type} (elapsed={int(elapsed)}s, count={event_count})")
+        try:
+            for event in http.stream_sse(
+                url,
+                headers=stream_headers,
+                timeout=MAX_TIMEOUT_SECONDS,
+                read_timeout=SSE_READ_TIMEOUT,
+            ):
+                event_count += 1
+                elapsed = time.time() - start_time
 
-            # Handle different event types
-            if event_type == "interaction.start":
-                sys.stderr.write(f"  [Gemini] 0m 00s - Starting research...\n")
+                # Overall timeout check
+                if elapsed >= MAX_TIMEOUT_SECONDS:
+                    raise ProviderTimeoutError("gemini", MAX_TIMEOUT_SECONDS, elapsed)
+
+                event_type = event.get("event", "")
+                data_str = event.get("data", "")
+                if event.get("id"):
+                    last_event_id = event["id"]
+
+                if http.DEBUG:
+                    http.log(f"SSE event: {event_type} (elapsed={int(elapsed)}s, count={event_count})")
+
+                # Handle different event types. JSON data is decoded only in the
+                # branches that read it; start/complete events are never parsed.
+                if event_type == "interaction.start":
+                    sys.stderr.write(f"  [Gemini] 0m 00s - Starting research...\n")
+                    sys.stderr.flush()
+
+                elif event_type == "content.delta":
+                    data = _decode_event_data(data_str)
+                    if data is None:
+                        continue
+                    content_type = data.get("type", "")
+
+                    if content_type == "thought_summary":
+                        # Display thinking summary on stderr
+                        summary_text = data.get("text", "")
+                        if summary_text:
+                            line = _format_thinking_line(elapsed, summary_text)
+                            sys.stderr.write(line + "\n")
+                            sys.stderr.flush()
+
+                    elif content_type == "text":
+                        # Accumulate report text
+                        text = data.get("text", "")
+                        if text:
+                            report_buf.write(text)
+
+                elif event_type in ("interaction.complete", "interaction.completed"):
+                    sys.stderr.write(f"  [Gemini] {_format_elapsed(elapsed)} - Complete\n")
+                    sys.stderr.flush()
+                    return report_buf.getvalue(), _decode_event_data(data_str) or {}
+
+                elif event_type == "error":
+                    data = _decode_event_data(data_str)
+                    if data is None:
+                        continue
+                    error_msg = data.get("message", "Unknown error")
+                    raise ProviderAPIError("gemini", 0, error_msg, elapsed)
+
+            # If the stream closes without interaction.complete, treat it like a
+            # dropped connection (resumable below)
+            raise http.HTTPError("SSE stream ended without interaction.complete event")
+
+        except http.HTTPError as e:
+            elapsed = time.time() - start_time
+            transient = e.status_code is None or e.status_code >= 500
+            can_resume = bool(last_event_id) or report_buf.tell() == 0
+            if (transient and can_resume and resumes < SSE_MAX_RESUMES
+                    and elapsed < MAX_TIMEOUT_SECONDS):
+                resumes += 1
+                sys.stderr.write(
+                    f"  [Gemini] SSE stream interrupted after {event_count} events"
+                    f" ({_format_elapsed(elapsed)}) — reconnecting"
+                    f" ({resumes}/{SSE_MAX_RESUMES})\n"
+                )
                 sys.stderr.flush()
-
-            elif event_type == "content.delta":
-                content_type = data.get("type", "")
-
-                if content_type == "thought_summary":
-                    # Display thinking summary on stderr
-                    summary_text = data.get("text", "")
-                    if summary_text:
-                        line = _format_thinking_line(elapsed, summary_text)
-                        sys.stderr.write(line + "\n")
-                        sys.stderr.flush()
-
-                elif content_type == "text":
-                    # Accumulate report text
-                    text = data.get("text", "")
-                    if text:
-                        report_parts.append(text)
-
-            elif event_type in ("interaction.complete", "interaction.completed"):
-                minutes = int(elapsed) // 60
-                seconds = int(elapsed) % 60
-                sys.stderr.write(f"  [Gemini] {minutes}m {seconds:02d}s - Complete\n")
+                http.log(f"SSE resume from Last-Event-ID={last_event_id!r}: {e}")
+                continue
+
+            # Log informative message when SSE silent timeout triggers (DEC-TIMEOUT-007)
+            if "TimeoutError" in str(e) or "SSE stream error" in str(e):
+                sys.stderr.write(
+                    f"  [Gemini] SSE silent for {SSE_READ_TIMEOUT}s after {event_count} events"
+                    f" ({_format_elapsed(elapsed)}) — falling back to polling\n"
+                )
                 sys.stderr.flush()
-                return ''.join(report_parts)
+            # Re-raise to let research() decide whether to fall back to polling
+            raise
+        except Exception as e:
+            # Wrap other exceptions
+            raise http.HTTPError(f"SSE stream error: {type(e).__name__}: {e}")
 
-            elif event_type == "error":
-                error_msg = data.get("message", "Unknown error")
-                elapsed = time.time() - start_time
-                raise ProviderAPIError("gemini", 0, error_msg, elapsed)
 
-    except http.HTTPError as e:
-        # Log informative message when SSE silent timeout triggers (DEC-TIMEOUT-007)
-        elapsed = time.time() - start_time
-        minutes = int(elapsed) // 60
-        seconds = int(elapsed) % 60
-        if "TimeoutError" in str(e) or "SSE stream error" in str(e):
-            sys.stderr.write(
-                f"  [Gemini] SSE silent for {SSE_READ_TIMEOUT}s after {event_count} events"
-                f" ({minutes}m {seconds:02d}s) — falling back to polling\n"
-            )
-            sys.stderr.flush()
-        # Re-raise to let research() decide whether to fall back to polling
-        raise
-    except Exception as e:
-        # Wrap other exceptions
-        raise http.HTTPError(f"SSE stream error: {type(e).__name__}: {e}")
+# Inline URLs in report markdown; stops at whitespace or closing ) > ]
+_URL_RE = re.compile(r'https?://[^\s\)>\]]+')
+
 
-    # If we exit the loop without interaction.complete, something went wrong
-    raise http.HTTPError("SSE stream ended without interaction.complete event")
+def _extract_sources(response: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Extract structured citations (sources / grounding metadata) from a response."""
+    citations = []
+    sources = response.get("sources", response.get("groundingMetadata", {}).get("webSearchQueries", []))
+    if isinstance(sources, list):
+        for src in sources:
+            if isinstance(src, str):
+                citations.append({"url": src})
+            elif isinstance(src, dict):
+                citations.append({
+                    "url": src.get("url", src.get("uri", "")),
+                    "title": src.get("title", ""),
+                })
+    return citations
 
 
 def _extract_report(response: Dict[str, Any]) -> Tuple[str, List[Any]]:
@@ -280,7 +429,6 @@ def _extract_report(response: Dict[str, Any]) -> Tuple[str, List[Any]]:
         Tuple of (report_text, citations_list)
     """
     report = ""
-    citations = []
 
     # Try multiple response shapes the API may return
     outputs = response.get("outputs", [])
@@ -299,27 +447,14 @@ def _extract_report(response: Dict[str, Any]) -> Tuple[str, List[Any]]:
             report = result.get("text", result.get("content", ""))
 
     # Extract citations from structured sources if present
-    sources = response.get("sources", response.get("groundingMetadata", {}).get("webSearchQueries", []))
-    if isinstance(sources, list):
-        for src in sources:
-            if isinstance(src, str):
-                citations.append({"url": src})
-            elif isinstance(src, dict):
-                citations.append({
-                    "url": src.get("url", src.get("uri", "")),
-                    "title": src.get("title", ""),
-                })
+    citations = _extract_sources(response)
 
     # Fallback: extract inline URLs from report text (Gemini embeds grounding
     # redirect URLs directly in the markdown)
     if not citations and report:
-        import re
-        urls = re.findall(r'https?://[^\s\)>\]]+', report)
-        seen = set()
-        for url in urls:
-            if url not in seen:
-                seen.add(url)
-                citations.append({"url": url})
+        # dict.fromkeys dedupes in C while preserving first-seen order
+        unique_urls = dict.fromkeys(_URL_RE.findall(report))
+        citations = [{"url": url} for url in islice(unique_urls, MAX_INLINE_CITATIONS)]
 
     return report, citations
 
@@ -349,15 +484,15 @@ def research(api_key: str, topic: str) -> Tuple[str, List[Any], str]:
         raise ProviderAPIError("gemini", 0, "No interaction ID returned")
 
     # Check if already completed (unlikely with background=true, but handle it)
-    status = resp.get("status", resp.get("metadata", {}).get("status", ""))
-    if status in ("completed", "COMPLETED"):
+    if _interaction_status(resp).lower() in _COMPLETED:
         report, citations = _extract_report(resp)
         return report, citations, AGENT
 
     # Try SSE streaming first
     report = None
+    final_data: Dict[str, Any] = {}
     try:
-        report = _stream_response(api_key, interaction_id)
+        report, final_data = _stream_response(api_key, interaction_id)
     except http.HTTPError as e:
         # If it's a connection error (not an API error), fall back to polling
         if e.status_code is None or e.status_code >= 500:
@@ -371,8 +506,12 @@ def research(api_key: str, topic: str) -> Tuple[str, List[Any], str]:
 
     # If streaming succeeded, extract citations
     if report:
-        # SSE stream returns report text directly; citations come from final GET
-        # We need to fetch the final state to get citations
+        # SSE stream returns report text directly. Citations come from the
+        # interaction.complete payload when it carries sources; otherwise fetch
+        # the final state with one extra GET.
+        citations = _extract_sources(final_data)
+        if citations:
+            return report, citations, AGENT
         try:
             completed = http.get(
                 f"{BASE_URL}/interactions/{interaction_id}",
@@ -18,35 +18,98 @@ established. This causes readline() to raise TimeoutError after read_timeout sec
 of server silence, which the caller can use to detect and escape zombie streams. The
 existing TimeoutError handler in the streaming loop converts it to an HTTPError.
 
+DEC-HTTP-POOL-001: request() reuses keep-alive connections from a small module-level
+pool keyed by (scheme, host:port) instead of opening a fresh TCP+TLS connection per
+call via urlopen. Provider polling loops issue dozens of GETs to the same host over a
+30-minute run, so handshake elimination is the dominant per-request win. Connections
+are checked out for the duration of a single request (so concurrent provider threads
+never share one) and returned only when the server allows keep-alive. A stale pooled
+connection (server closed it while idle) is retried once on a fresh connection before
+the normal retry/backoff logic sees the failure. JSON API endpoints do not redirect,
+so request() does not follow 3xx responses; stream_sse() still uses urllib.
+The pool is a ConnectionPool instance; validate.py creates its own per
+validate_citations() call, keeping several idle connections per host.
+request() advertises Accept-Encoding: gzip and get_if_changed() adds If-None-Match,
+so repeated status polls of a large interaction cost a 304 or a compressed body.
+Environment proxies are honoured as urllib does: https is tunnelled with CONNECT,
+plain http is sent to the proxy as an absolute-URI request, and credentials in the
+proxy URL become a Basic Proxy-Authorization header either way.
+
+DEC-HTTP-SSE-PARSE-001: SSE parsing is an incremental SSEParser (feed() per line,
+state kept between calls). stream_sse() feeds it every complete line of each
+read1() batch and keeps one parser for the whole stream, so only a trailing
+partial line is re-buffered between reads, never a partial event.
+
+DEC-HTTP-SSE-SOCK-001: stream_sse() opens its connection through a dedicated urllib
+opener whose connection classes set TCP_NODELAY and a 1 MiB SO_RCVBUF right after
+connect(). SSE events are small, individually flushed writes interleaved with large
+report deltas; disabling Nagle avoids delayed-ACK stalls on the small ones and the
+larger receive buffer cuts recv() syscalls on the large ones.
+
 Supports retry with exponential backoff for transient failures and rate limits.
 """
 
+import base64
+import contextlib
+import datetime
+import email.utils
+import gzip
+import http.client as http_client
 import json
 import os
 import random
+import socket
 import sys
+import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
 
 DEFAULT_TIMEOUT = 60
 DEBUG = os.environ.get("DEEP_RESEARCH_DEBUG", "").lower() in ("1", "true", "yes")
 
 
-def log(msg: str):
+def _log_stderr(msg: str):
     """Log debug message to stderr."""
-    if DEBUG:
-        sys.stderr.write(f"[DEBUG] {msg}\n")
-        sys.stderr.flush()
+    sys.stderr.write(f"[DEBUG] {msg}\n")
+    sys.stderr.flush()
+
+
+def _log_noop(msg: str):
+    """Discard debug message (DEBUG off)."""
+
+
+def set_debug(enabled: bool) -> None:
+    """Enable or disable debug logging.
+
+    log is rebound rather than checking DEBUG on every call, so disabled
+    logging costs one function call. Callers that build expensive messages
+    in hot loops should additionally guard with `if http.DEBUG:` so the
+    f-string is never formatted.
+    """
+    global DEBUG, log
+    DEBUG = enabled
+    log = _log_stderr if enabled else _log_noop
+
+
+log = _log_noop
+set_debug(DEBUG)
 
 
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 2.0
 RETRY_429_BASE_DELAY = 5.0
 RETRY_MAX_DELAY = 60.0
+RETRY_AFTER_MIN = 1.0
+RETRY_AFTER_MAX = 1800.0
 USER_AGENT = "deep-research-skill/1.0 (Claude Code Skill)"
 
+# Compact request bodies: no whitespace after separators, UTF-8 passed through
+# rather than \u-escaped. Encoded once per request and reused across retries.
+_JSON_ENCODE = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
 
 class HTTPError(Exception):
     """HTTP request error with status code."""
@@ -58,6 +121,35 @@ class HTTPError(Exception):
         self.retry_after = retry_after
 
 
+def _parse_retry_after(raw: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header value into seconds.
+
+    RFC 7231 allows either delta-seconds ("120") or an HTTP-date
+    ("Wed, 21 Oct 2015 07:28:00 GMT"). Values are clamped to
+    [RETRY_AFTER_MIN, RETRY_AFTER_MAX]: "0" or a past date still waits a
+    second, and a very long wait is capped rather than discarded (the caller
+    caps it again at RETRY_MAX_DELAY), so a throttled API is never retried
+    sooner than it asked.
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable.
+    """
+    if not raw:
+        return None
+    raw = raw.strip()
+    try:
+        seconds = float(raw)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(raw)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=datetime.timezone.utc)
+        seconds = (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+    return max(RETRY_AFTER_MIN, min(seconds, RETRY_AFTER_MAX))
+
+
 def _get_retry_delay(attempt: int, is_rate_limit: bool = False,
                      retry_after: Optional[float] = None) -> float:
     """Calculate retry delay with exponential backoff and jitter."""
@@ -71,40 +163,222 @@ def _get_retry_delay(attempt: int, is_rate_limit: bool = False,
     return delay + jitter
 
 
-def request(
+# Raised when a pooled connection was closed by the server while idle.
+_STALE_CONNECTION_ERRORS = (
+    http_client.RemoteDisconnected,
+    http_client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+def _proxy_for(scheme: str, host: str) -> Optional[urllib.parse.SplitResult]:
+    """Proxy URL configured for scheme (urllib's *_proxy/no_proxy rules), or None."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    return urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+
+def _proxy_headers(proxy: urllib.parse.SplitResult) -> Dict[str, str]:
+    """Basic Proxy-Authorization for credentials in the proxy URL, as urllib sends it."""
+    if proxy.username is None:
+        return {}
+    user_pass = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(user_pass.encode()).decode("ascii")}
+
+
+def _new_connection(
+    scheme: str,
+    host: str,
+    timeout: float,
+    proxy: Optional[urllib.parse.SplitResult] = None,
+) -> http_client.HTTPConnection:
+    """Open a new connection to host, or to proxy when one applies.
+
+    As with urllib, https is tunnelled with CONNECT; plain http connects to the
+    proxy itself and ConnectionPool.open() sends the absolute URL as the target.
+    """
+    if scheme == "https":
+        conn_cls = http_client.HTTPSConnection
+    elif scheme == "http":
+        conn_cls = http_client.HTTPConnection
+    else:
+        raise HTTPError(f"URL Error: unsupported URL scheme {scheme!r}")
+
+    if proxy is None:
+        return conn_cls(host, timeout=timeout)
+    conn = conn_cls(proxy.hostname, proxy.port, timeout=timeout)
+    if scheme == "https":
+        conn.set_tunnel(host, headers=_proxy_headers(proxy))
+    return conn
+
+
+class ConnectionPool:
+    """Idle keep-alive connections keyed by (scheme, netloc). See DEC-HTTP-POOL-001.
+
+    Connections are checked out for the duration of one request, so threads
+    never share a connection; up to max_idle_per_host are kept per key.
+    """
+
+    def __init__(self, max_idle_per_host: int = 1):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: Dict[Tuple[str, str], List[http_client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def checkout(
+        self,
+        key: Tuple[str, str],
+        timeout: float,
+        proxy: Optional[urllib.parse.SplitResult] = None,
+    ) -> Tuple[http_client.HTTPConnection, bool]:
+        """Take an idle pooled connection for key, or open a new one (through proxy, if set).
+
+        Returns:
+            Tuple of (connection, reused) where reused is True for a pooled connection.
+        """
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is None:
+            return _new_connection(key[0], key[1].rpartition("@")[2], timeout, proxy), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def checkin(self, key: Tuple[str, str], conn: http_client.HTTPConnection) -> None:
+        """Return a connection to the pool (closing it if the key is already full)."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        with self._lock:
+            conns = [conn for idle in self._idle.values() for conn in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
+    @contextlib.contextmanager
+    def open(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> Iterator[http_client.HTTPResponse]:
+        """Send a request and yield the response for the caller to read.
+
+        A pooled connection that turns out to be stale is retried once on a fresh
+        connection. All other failures propagate to the caller's retry logic.
+        On exit the connection is pooled only if the body was fully read and
+        the server allows keep-alive; otherwise it is closed.
+        """
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        host = parts.netloc.rpartition("@")[2]
+        proxy = _proxy_for(parts.scheme, host)
+        if proxy is not None and parts.scheme == "http":
+            # Plain-http proxying: absolute-form target, credentials per request
+            path = f"http://{host}{path}"
+            headers = {**headers, **_proxy_headers(proxy)}
+
+        while True:
+            conn, reused = self.checkout(key, timeout, proxy)
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                response = conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    log("Pooled connection was stale, reconnecting")
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            break
+
+        try:
+            yield response
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close or not response.isclosed():
+            conn.close()
+        else:
+            self.checkin(key, conn)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+        max_bytes: Optional[int] = None,
+    ) -> Tuple[int, str, http_client.HTTPMessage, bytes]:
+        """Send a single request over a pooled keep-alive connection.
+
+        When max_bytes is set, at most that much of the body is read; a
+        connection with unread body left is closed rather than pooled.
+
+        Returns:
+            Tuple of (status, reason, response_headers, body_bytes)
+        """
+        with self.open(method, url, data, headers, timeout) as response:
+            body = response.read() if max_bytes is None else response.read(max_bytes)
+        return response.status, response.reason, response.headers, body
+
+
+# Shared pool for provider API calls made through request().
+_POOL = ConnectionPool()
+
+
+def close_connections() -> None:
+    """Close all idle connections in the shared provider pool."""
+    _POOL.close()
+
+
+def _decode_body(raw: bytes, resp_headers: http_client.HTTPMessage) -> bytes:
+    """Undo gzip Content-Encoding (requested via Accept-Encoding in request())."""
+    if raw and resp_headers.get("Content-Encoding", "").lower() == "gzip":
+        return gzip.decompress(raw)
+    return raw
+
+
+def _request(
     method: str,
     url: str,
     headers: Optional[Dict[str, str]] = None,
     json_data: Optional[Dict[str, Any]] = None,
     timeout: int = DEFAULT_TIMEOUT,
     retries: int = MAX_RETRIES,
-) -> Dict[str, Any]:
-    """Make an HTTP request and return JSON response.
-
-    Args:
-        method: HTTP method (GET, POST, etc.)
-        url: Request URL
-        headers: Optional headers dict
-        json_data: Optional JSON body (for POST)
-        timeout: Request timeout in seconds
-        retries: Number of retries on failure
+) -> Tuple[int, http_client.HTTPMessage, Dict[str, Any]]:
+    """Make an HTTP request with retries; see request().
 
     Returns:
-        Parsed JSON response
-
-    Raises:
-        HTTPError: On request failure
+        Tuple of (status, response_headers, parsed_json). A 304 response
+        yields an empty dict.
     """
     headers = headers or {}
     headers.setdefault("User-Agent", USER_AGENT)
+    headers.setdefault("Accept-Encoding", "gzip")
 
     data = None
     if json_data is not None:
-        data = json.dumps(json_data).encode('utf-8')
+        data = _JSON_ENCODE(json_data).encode('utf-8')
         headers.setdefault("Content-Type", "application/json")
 
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
-
     log(f"{method} {url}")
     if json_data:
         log(f"Payload keys: {list(json_data.keys())}")
@@ -112,62 +386,108 @@ def request(
     last_error = None
     for attempt in range(retries):
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                body = response.read().decode('utf-8')
-                log(f"Response: {response.status} ({len(body)} bytes)")
-                return json.loads(body) if body else {}
-        except urllib.error.HTTPError as e:
-            body = None
-            try:
-                body = e.read().decode('utf-8')
-            except Exception:
-                pass
-            log(f"HTTP Error {e.code}: {e.reason}")
-            if body:
-                log(f"Error body: {body[:500]}")
-
-            retry_after = None
-            retry_after_raw = e.headers.get("Retry-After") if e.headers else None
-            if retry_after_raw:
-                try:
-                    retry_after = float(retry_after_raw)
-                except (ValueError, TypeError):
-                    pass
-
-            last_error = HTTPError(f"HTTP {e.code}: {e.reason}", e.code, body, retry_after)
-
-            if 400 <= e.code < 500 and e.code != 429:
-                raise last_error
-
-            if attempt < retries - 1:
-                is_rate_limit = (e.code == 429)
-                delay = _get_retry_delay(attempt, is_rate_limit, retry_after)
-                log(f"Retrying in {delay:.1f}s (attempt {attempt + 1}/{retries})")
-                time.sleep(delay)
-        except urllib.error.URLError as e:
-            log(f"URL Error: {e.reason}")
-            last_error = HTTPError(f"URL Error: {e.reason}")
-            if attempt < retries - 1:
-                delay = _get_retry_delay(attempt)
-                log(f"Retrying in {delay:.1f}s (attempt {attempt + 1}/{retries})")
-                time.sleep(delay)
-        except json.JSONDecodeError as e:
-            log(f"JSON decode error: {e}")
-            last_error = HTTPError(f"Invalid JSON response: {e}")
-            raise last_error
-        except (OSError, TimeoutError, ConnectionResetError) as e:
+            status, reason, resp_headers, raw = _POOL.send(method, url, data, headers, timeout)
+        except (OSError, http_client.HTTPException) as e:
             log(f"Connection error: {type(e).__name__}: {e}")
             last_error = HTTPError(f"Connection error: {type(e).__name__}: {e}")
             if attempt < retries - 1:
                 delay = _get_retry_delay(attempt)
                 log(f"Retrying in {delay:.1f}s (attempt {attempt + 1}/{retries})")
                 time.sleep(delay)
+            continue
+
+        try:
+            raw = _decode_body(raw, resp_headers)
+        except (OSError, EOFError) as e:
+            raise HTTPError(f"Invalid gzip response: {e}", status)
+
+        if status < 400:
+            log(f"Response: {status} ({len(raw)} bytes)")
+            # json.loads() accepts UTF-8 bytes directly, so the body is never
+            # copied into an intermediate str (interaction bodies can be MBs).
+            try:
+                return status, resp_headers, json.loads(raw) if raw else {}
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                log(f"JSON decode error: {e}")
+                raise HTTPError(f"Invalid JSON response: {e}")
+
+        body = raw.decode('utf-8', errors='replace') or None
+        log(f"HTTP Error {status}: {reason}")
+        if body:
+            log(f"Error body: {body[:500]}")
+
+        retry_after = _parse_retry_after(resp_headers.get("Retry-After"))
+
+        last_error = HTTPError(f"HTTP {status}: {reason}", status, body, retry_after)
+
+        if 400 <= status < 500 and status != 429:
+            raise last_error
+
+        if attempt < retries - 1:
+            is_rate_limit = (status == 429)
+            delay = _get_retry_delay(attempt, is_rate_limit, retry_after)
+            log(f"Retrying in {delay:.1f}s (attempt {attempt + 1}/{retries})")
+            time.sleep(delay)
 
     if last_error:
         raise last_error
     raise HTTPError("Request failed with no error details")
 
 
+def request(
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    json_data: Optional[Dict[str, Any]] = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    retries: int = MAX_RETRIES,
+) -> Dict[str, Any]:
+    """Make an HTTP request and return JSON response.
+
+    Args:
+        method: HTTP method (GET, POST, etc.)
+        url: Request URL
+        headers: Optional headers dict
+        json_data: Optional JSON body (for POST)
+        timeout: Request timeout in seconds
+        retries: Number of retries on failure
+
+    Returns:
+        Parsed JSON response
+
+    Raises:
+        HTTPError: On request failure
+    """
+    return _request(method, url, headers, json_data, timeout, retries)[2]
+
+
+def get_if_changed(
+    url: str,
+    etag: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+    **kwargs,
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Conditional GET using If-None-Match.
+
+    Args:
+        url: Request URL
+        etag: ETag from the previous response, if any
+        headers: Optional headers dict
+        **kwargs: Passed through to request() (timeout, retries)
+
+    Returns:
+        Tuple of (parsed_json, etag). parsed_json is None when the server
+        answered 304 Not Modified; etag is the value to send next time.
+    """
+    headers = dict(headers or {})
+    if etag:
+        headers["If-None-Match"] = etag
+    status, resp_headers, data = _request("GET", url, headers=headers, **kwargs)
+    if status == 304:
+        return None, etag
+    return data, resp_headers.get("ETag")
+
+
 def get(url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> Dict[str, Any]:
     """Make a GET request."""
     return request("GET", url, headers=headers, **kwargs)
@@ -178,65 +498,138 @@ def post(url: str, json_data: Dict[str, Any], headers: Optional[Dict[str, str]]
     return request("POST", url, headers=headers, json_data=json_data, **kwargs)
 
 
-def _parse_sse_lines(lines: List[str]) -> List[Dict[str, str]]:
-    """Parse SSE-formatted lines into event dictionaries.
+SSE_RCVBUF_BYTES = 1 << 20
+
+
+def _tune_stream_socket(sock: socket.socket) -> None:
+    """Apply streaming socket options (DEC-HTTP-SSE-SOCK-001). Best effort."""
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SSE_RCVBUF_BYTES)
+    except OSError as e:
+        log(f"SSE socket options could not be set: {e}")
+
+
+class _SSEHTTPConnection(http_client.HTTPConnection):
+    def connect(self):
+        super().connect()
+        _tune_stream_socket(self.sock)
+
+
+class _SSEHTTPSConnection(http_client.HTTPSConnection):
+    def connect(self):
+        super().connect()
+        _tune_stream_socket(self.sock)
+
+
+class _SSEHTTPHandler(urllib.request.HTTPHandler):
+    def http_open(self, req):
+        return self.do_open(_SSEHTTPConnection, req)
+
+
+class _SSEHTTPSHandler(urllib.request.HTTPSHandler):
+    def https_open(self, req):
+        return self.do_open(_SSEHTTPSConnection, req, context=self._context)
+
+
+_SSE_OPENER = urllib.request.build_opener(_SSEHTTPHandler(), _SSEHTTPSHandler())
+
+
+class SSEParser:
+    """Incremental SSE parser: feed() one line at a time, state kept between calls.
 
     SSE protocol: lines starting with 'data:' contain payload,
     'event:' is the event type, 'id:' is the event ID.
     Blank lines delimit events. Comment lines (starting with ':') are ignored.
     Multi-line data fields are concatenated with newlines.
 
-    Args:
-        lines: List of SSE-formatted lines (with or without trailing newlines)
-
-    Returns:
-        List of event dicts with keys 'event', 'data', 'id' (all strings, may be empty)
+    Each line is processed exactly once, and a partially received event stays
+    in the parser, so stream_sse() can hand over lines as soon as they are
+    complete instead of waiting for (and re-buffering up to) an event boundary.
+    The data_parts scratch list is cleared and reused rather than reallocated
+    per event.
     """
-    events = []
-    current_event: Dict[str, str] = {"event": "", "data": "", "id": ""}
-    data_parts: List[str] = []
 
-    for line in lines:
+    __slots__ = ("event", "data_parts", "id")
+
+    def __init__(self):
+        self.event = ""
+        self.data_parts: List[str] = []
+        self.id = ""
+
+    def _dispatch(self) -> Optional[Dict[str, str]]:
+        if not (self.event or self.data_parts or self.id):
+            return None
+        event = {"event": self.event, "data": '\n'.join(self.data_parts), "id": self.id}
+        self.event = ""
+        self.id = ""
+        self.data_parts.clear()
+        return event
+
+    def feed(self, line: str) -> Optional[Dict[str, str]]:
+        """Process one line (with or without its newline).
+
+        Returns:
+            The finished event dict (keys 'event', 'data', 'id') when line is
+            the blank delimiter of a non-empty event, else None
+        """
         line = line.rstrip('\r\n')
 
+        # Blank line - event delimiter; emit only if the event has content
+        if not line:
+            return self._dispatch()
+
         # Comment line - skip
-        if line.startswith(':'):
-            continue
+        if line[0] == ':':
+            return None
 
-        # Blank line - event delimiter
-        if not line:
-            # Flush accumulated data
-            if data_parts:
-                current_event["data"] = '\n'.join(data_parts)
-                data_parts = []
-
-            # Emit event if it has any content
-            if current_event["event"] or current_event["data"] or current_event["id"]:
-                events.append(current_event)
-                current_event = {"event": "", "data": "", "id": ""}
-            continue
+        # SSE spec: a line without a colon is a field name with an empty value;
+        # otherwise remove a single leading space after the colon (if present)
+        field, sep, value = line.partition(':')
+        if sep and value[:1] == ' ':
+            value = value[1:]
 
-        # Parse field
-        if ':' in line:
-            field, _, value = line.partition(':')
-            # SSE spec: remove single leading space after colon (if present)
-            if value.startswith(' '):
-                value = value[1:]
+        if field == "data":
+            self.data_parts.append(value)
+        elif field == "event":
+            self.event = value
+        elif field == "id":
+            self.id = value
+        return None
 
-            if field == "event":
-                current_event["event"] = value
-            elif field == "data":
-                data_parts.append(value)
-            elif field == "id":
-                current_event["id"] = value
+    def flush(self) -> Optional[Dict[str, str]]:
+        """Return the pending event at end of stream (no trailing blank line), if any."""
+        return self._dispatch()
 
-    # Flush final event if present (no trailing blank line)
-    if data_parts:
-        current_event["data"] = '\n'.join(data_parts)
-    if current_event["event"] or current_event["data"] or current_event["id"]:
-        events.append(current_event)
 
-    return events
+def _iter_sse_events(lines: Iterable[str]) -> Generator[Dict[str, str], None, None]:
+    """Parse SSE-formatted lines into event dicts with a fresh SSEParser.
+
+    A final event without a trailing blank line is still yielded.
+
+    Args:
+        lines: SSE-formatted lines (with or without trailing newlines)
+
+    Yields:
+        Dict with keys 'event', 'data', 'id' (all strings, may be empty)
+    """
+    parser = SSEParser()
+    feed = parser.feed
+    for line in lines:
+        event = feed(line)
+        if event is not None:
+            yield event
+    event = parser.flush()
+    if event is not None:
+        yield event
+
+
+def _parse_sse_lines(lines: List[str]) -> List[Dict[str, str]]:
+    """Parse SSE-formatted lines into a list of event dicts (see SSEParser)."""
+    return list(_iter_sse_events(lines))
+
+
+SSE_READ_CHUNK = 8192
 
 
 def stream_sse(
@@ -255,11 +648,13 @@ def stream_sse(
         url: SSE endpoint URL
         headers: Optional headers dict
         timeout: Socket timeout in seconds for the initial connection
-        read_timeout: Per-read socket timeout in seconds, applied after the
-            connection is established. When the server goes silent, readline()
-            will raise TimeoutError after this many seconds instead of waiting
-            for the full connection timeout. None means use the connection timeout.
-            See DEC-TIMEOUT-007.
+        read_timeout: Per-read socket timeout in seconds. When the server goes
+            silent, reads raise TimeoutError after this many seconds instead of
+            waiting for the full connection timeout. It also bounds the connect
+            and response-header phase (the effective open timeout is
+            min(timeout, read_timeout)), so a server that accepts the socket but
+            never answers is detected just as quickly. None means use the
+            connection timeout. See DEC-TIMEOUT-007.
 
     Yields:
         Dict with keys 'event', 'data', 'id' (all strings, may be empty)
@@ -273,6 +668,7 @@ def stream_sse(
     headers.setdefault("Cache-Control", "no-cache")
 
     req = urllib.request.Request(url, headers=headers, method="GET")
+    open_timeout = timeout if read_timeout is None else min(timeout, read_timeout)
 
     log(f"Opening SSE stream: {url}")
 
@@ -280,7 +676,7 @@ def stream_sse(
     last_error = None
     for attempt in range(MAX_RETRIES):
         try:
-            response = urllib.request.urlopen(req, timeout=timeout)
+            response = _SSE_OPENER.open(req, timeout=open_timeout)
             # Apply a shorter per-read timeout after connection is established.
             # This is the zombie detection mechanism (DEC-TIMEOUT-007): if the
             # server goes silent mid-stream, readline() will raise TimeoutError
@@ -322,13 +718,7 @@ def stream_sse(
             if body:
                 log(f"Error body: {body[:500]}")
 
-            retry_after = None
-            retry_after_raw = e.headers.get("Retry-After") if e.headers else None
-            if retry_after_raw:
-                try:
-                    retry_after = float(retry_after_raw)
-                except (ValueError, TypeError):
-                    pass
+            retry_after = _parse_retry_after(e.headers.get("Retry-After") if e.headers else None)
 
             last_error = HTTPError(f"HTTP {e.code}: {e.reason}", e.code, body, retry_after)
 
@@ -354,29 +744,41 @@ def stream_sse(
             raise last_error
         raise HTTPError("SSE connection failed with no error details")
 
-    # Stream events line by line
+    # Stream events in batches. read1() returns whatever is already buffered
+    # (up to SSE_READ_CHUNK bytes) with at most one recv(). Every complete line
+    # in the batch (up to the last newline, found in C with rfind()) is decoded
+    # at once and fed to one SSEParser that lives for the whole stream, so only
+    # a trailing partial line is carried over between reads — never a partial
+    # event — and no line is scanned twice.
+    parser = SSEParser()
+    feed = parser.feed
     try:
-        buffer: List[str] = []
+        buf = bytearray()
         while True:
             try:
-                line_bytes = response.readline()
-                if not line_bytes:
-                    # EOF - flush final event if present
-                    if buffer:
-                        events = _parse_sse_lines(buffer)
-                        for event in events:
+                chunk = response.read1(SSE_READ_CHUNK)
+                if not chunk:
+                    # EOF - flush final line and event (no trailing blank line)
+                    if buf:
+                        event = feed(buf.decode('utf-8', 'replace'))
+                        if event is not None:
                             yield event
+                    event = parser.flush()
+                    if event is not None:
+                        yield event
                     break
 
-                line = line_bytes.decode('utf-8')
-                buffer.append(line)
-
-                # Check if we hit an event delimiter (blank line)
-                if line.rstrip('\r\n') == '':
-                    events = _parse_sse_lines(buffer)
-                    for event in events:
-                        yield event
-                    buffer = []
+                buf += chunk
+                end = buf.rfind(b'\n')
+                if end >= 0:
+                    # buf[:end] drops the final newline, so split() yields no
+                    # spurious empty line that the parser would read as a delimiter.
+                    text = buf[:end].decode('utf-8', 'replace')
+                    del buf[:end + 1]
+                    for line in text.split('\n'):
+                        event = feed(line)
+                        if event is not None:
+                            yield event
             except (TimeoutError, OSError) as e:
                 # Socket timeout or connection error during streaming
                 raise HTTPError(f"SSE stream error: {type(e).__name__}: {e}")
@@ -46,8 +46,11 @@ this decision: 'exact', 'heading-fuzzy', 'unmatched'.
 """
 
 import re
-from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional, Set, Tuple
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 # Word count threshold separating 'detailed' from 'mentioned' coverage.
 DETAILED_WORD_THRESHOLD = 100
@@ -71,6 +74,15 @@ STOP_WORDS = frozenset({
 })
 
 
+# Precompiled helper patterns. Character classes that only need ASCII are
+# spelled out explicitly; \s stays Unicode-aware so non-breaking spaces in
+# headings still collapse.
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_BULLET_PREFIX_RE = re.compile(r"^[-*•]\s+")
+_NUMBER_PREFIX_RE = re.compile(r"^[0-9A-Za-z]+[.)]\s+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
@@ -87,6 +99,8 @@ class Topic:
         coverage: 'detailed' (≥100 words) or 'mentioned' (<100 words).
         citations_in_section: Number of URLs found in the section body.
         body_keywords: Significant keywords from section body (stop-word filtered).
+        words: Word set of `heading`, derived once at construction so fuzzy
+            matching never re-tokenizes headings (not a constructor argument).
     """
     heading: str
     raw_heading: str
@@ -95,6 +109,10 @@ class Topic:
     coverage: str  # 'detailed' | 'mentioned'
     citations_in_section: int
     body_keywords: Set[str] = field(default_factory=set)
+    words: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.words = frozenset(self.heading.lower().split())
 
 
 @dataclass
@@ -189,16 +207,25 @@ def _extract_body_keywords(text: str) -> Set[str]:
     Returns:
         Set of cleaned keyword strings.
     """
+    return _keywords_from_words(text.lower().split())
+
+
+def _keywords_from_words(lowered_words: List[str]) -> Set[str]:
+    """Keyword set from already-lowercased, whitespace-split words.
+
+    Lets extract_topics() split each section once and reuse the word list
+    for both the word count and keyword extraction.
+    """
     words: Set[str] = set()
-    for word in text.lower().split():
-        cleaned = re.sub(r'[^a-z0-9]', '', word)
+    for word in lowered_words:
+        cleaned = _NON_ALNUM_RE.sub('', word)
         if cleaned and len(cleaned) > 1 and cleaned not in STOP_WORDS:
             words.add(cleaned)
     return words
 
 
-def _jaccard_similarity_sets(a: Set[str], b: Set[str]) -> float:
-    """Jaccard similarity between two pre-computed keyword sets.
+def _jaccard_similarity_sets(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity between two pre-computed word sets.
 
     Args:
         a: First keyword set.
@@ -211,12 +238,20 @@ def _jaccard_similarity_sets(a: Set[str], b: Set[str]) -> float:
         return 1.0
     if not a or not b:
         return 0.0
-    return len(a & b) / len(a | b)
+    # |A ∪ B| = |A| + |B| - |A ∩ B|: avoids materializing the union set.
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
 
 
+@lru_cache(maxsize=4096)
 def _normalize_heading(text: str) -> str:
     """Normalize a heading for comparison.
 
+    Memoized: common headings ("Introduction", "Key Findings") recur across
+    providers and runs. Pure function of its input; see reset_caches().
+    Results are interned so the many dicts keyed by heading share one object
+    and hit CPython's identity fast path on lookup.
+
     Steps:
     1. Strip leading/trailing whitespace.
     2. Strip leading list/dash prefix (e.g. "- ").
@@ -233,19 +268,19 @@ def _normalize_heading(text: str) -> str:
     """
     s = text.strip()
     # Strip leading dash or bullet
-    s = re.sub(r"^[-*•]\s+", "", s)
+    s = _BULLET_PREFIX_RE.sub("", s)
     # Strip leading numbering: "1. ", "2) ", "a. ", "A. "
-    s = re.sub(r"^[0-9A-Za-z]+[.)]\s+", "", s)
+    s = _NUMBER_PREFIX_RE.sub("", s)
     # Strip trailing punctuation
     s = s.rstrip(":.,;!?")
     # Lowercase and collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip().lower()
-    return s
+    s = _WHITESPACE_RE.sub(" ", s).strip().lower()
+    return sys.intern(s)
 
 
-def _count_urls(text: str) -> int:
-    """Count the number of http/https URLs in a block of text."""
-    return len(re.findall(r"https?://\S+", text))
+def reset_caches() -> None:
+    """Clear memoized helpers (for long-lived processes and tests)."""
+    _normalize_heading.cache_clear()
 
 
 def _jaccard_similarity(a: str, b: str) -> float:
@@ -254,25 +289,17 @@ def _jaccard_similarity(a: str, b: str) -> float:
     Empty strings are treated as empty sets. Two empty strings → 1.0.
     One empty string → 0.0.
     """
-    words_a: Set[str] = set(a.lower().split()) if a.strip() else set()
-    words_b: Set[str] = set(b.lower().split()) if b.strip() else set()
-
-    if not words_a and not words_b:
-        return 1.0
-    if not words_a or not words_b:
-        return 0.0
-
-    intersection = words_a & words_b
-    union = words_a | words_b
-    return len(intersection) / len(union)
+    return _jaccard_similarity_sets(frozenset(a.lower().split()), frozenset(b.lower().split()))
 
 
 # ---------------------------------------------------------------------------
 # Topic extraction
 # ---------------------------------------------------------------------------
 
-# Matches H1–H4 markdown headings at line start.
-_HEADING_RE = re.compile(r"^(#{1,4})\s+(.+)$", re.MULTILINE)
+# Single-pass scanner: an H1–H4 markdown heading at line start (groups 1–2),
+# or an http/https URL. Heading lines are consumed whole, so URLs inside a
+# heading are not counted toward any section.
+_HEADING_OR_URL_RE = re.compile(r"^(#{1,4})\s+(.+)$|https?://\S+", re.MULTILINE)
 
 
 def extract_topics(report: str) -> List[Topic]:
@@ -291,11 +318,24 @@ def extract_topics(report: str) -> List[Topic]:
     if not report or not report.strip():
         return []
 
-    matches = list(_HEADING_RE.finditer(report))
+    # One regex pass finds headings and buckets URL hits into the section
+    # currently open (URLs before the first heading go to the preamble).
+    matches: List[re.Match] = []
+    section_urls: List[int] = []
+    preamble_urls = 0
+    for m in _HEADING_OR_URL_RE.finditer(report):
+        if m.group(1) is not None:
+            matches.append(m)
+            section_urls.append(0)
+        elif section_urls:
+            section_urls[-1] += 1
+        else:
+            preamble_urls += 1
 
     if not matches:
         # Flat text — treat entire report as one implicit topic.
-        word_count = len(report.split())
+        words = report.lower().split()
+        word_count = len(words)
         coverage = "detailed" if word_count >= DETAILED_WORD_THRESHOLD else "mentioned"
         return [
             Topic(
@@ -304,8 +344,8 @@ def extract_topics(report: str) -> List[Topic]:
                 level=1,
                 word_count=word_count,
                 coverage=coverage,
-                citations_in_section=_count_urls(report),
-                body_keywords=_extract_body_keywords(report),
+                citations_in_section=preamble_urls,
+                body_keywords=_keywords_from_words(words),
             )
         ]
 
@@ -319,11 +359,18 @@ def extract_topics(report: str) -> List[Topic]:
         # Section body: text between this heading and the next heading (or EOF).
         body_start = match.end()
         body_end = matches[i + 1].start() if i + 1 < len(matches) else len(report)
-        body = report[body_start:body_end]
 
-        word_count = len(body.split())
+        # One split serves both the word count and keyword extraction
+        # (lowercasing never changes whitespace boundaries). The section slice
+        # is not bound to a name, so it is freed as soon as lower() returns and
+        # at most one transient copy of the section is alive during split().
+        # URLs were already counted in place by the finditer pass above; a
+        # regex word scan with pos/endpos would avoid the slice too, but is
+        # ~3x slower than slice+split on the fixture reports.
+        words = report[body_start:body_end].lower().split()
+        word_count = len(words)
         coverage = "detailed" if word_count >= DETAILED_WORD_THRESHOLD else "mentioned"
-        citation_count = _count_urls(body)
+        citation_count = section_urls[i]
 
         topics.append(Topic(
             heading=heading,
@@ -332,7 +379,7 @@ def extract_topics(report: str) -> List[Topic]:
             word_count=word_count,
             coverage=coverage,
             citations_in_section=citation_count,
-            body_keywords=_extract_body_keywords(body),
+            body_keywords=_keywords_from_words(words),
         ))
 
     return topics
@@ -342,10 +389,42 @@ def extract_topics(report: str) -> List[Topic]:
 # Cross-provider matching
 # ---------------------------------------------------------------------------
 
+def _build_word_index(topics: List[Topic]) -> Dict[str, List[int]]:
+    """Map each heading word to the indices of the topics containing it."""
+    index: Dict[str, List[int]] = defaultdict(list)
+    for idx, topic in enumerate(topics):
+        for word in topic.words:
+            index[word].append(idx)
+    return index
+
+
+def _build_word_masks(provider_topics: Dict[str, List[Topic]]) -> Dict[str, List[int]]:
+    """Encode each topic's heading words as an int bitmask over a shared vocabulary.
+
+    Bit i is set when the topic's heading contains the i-th distinct word seen
+    across all providers. Intersection size is then (a & b).bit_count(), which
+    is several times cheaper than intersecting small frozensets.
+    """
+    bits: Dict[str, int] = {}
+    masks: Dict[str, List[int]] = {}
+    for provider, topics in provider_topics.items():
+        provider_masks = []
+        for topic in topics:
+            mask = 0
+            for word in topic.words:
+                mask |= 1 << bits.setdefault(word, len(bits))
+            provider_masks.append(mask)
+        masks[provider] = provider_masks
+    return masks
+
+
 def _best_match(
     needle: Topic,
     candidates: List[Topic],
     used: Set[int],
+    word_index: Optional[Dict[str, List[int]]] = None,
+    needle_mask: Optional[int] = None,
+    candidate_masks: Optional[List[int]] = None,
 ) -> Optional[Tuple[int, float]]:
     """Find the best heading-based match for `needle` among unused candidates.
 
@@ -353,17 +432,49 @@ def _best_match(
     or None if no suitable match exists.
 
     Score 1.0 indicates an exact match; scores below 1.0 are heading-fuzzy.
+
+    When `word_index` (from _build_word_index(candidates)) is given, only
+    candidates sharing at least one heading word with the needle are scored —
+    any other candidate has Jaccard 0. They are visited in index order, so the
+    result is identical to a full scan.
+
+    When `needle_mask` and `candidate_masks` (from _build_word_masks()) are
+    given, intersection sizes are computed by popcount instead of set algebra.
     """
+    # Every candidate already claimed by another cluster — nothing to scan.
+    if len(used) >= len(candidates):
+        return None
+
     best_idx: Optional[int] = None
     best_score = FUZZY_MATCH_THRESHOLD - 1e-9  # just below threshold
+    needle_len = len(needle.words)
+
+    if word_index is not None and needle.words:
+        shared: Set[int] = set()
+        for word in needle.words:
+            shared.update(word_index.get(word, ()))
+        candidate_idxs = sorted(shared)
+    else:
+        candidate_idxs = range(len(candidates))
 
-    for idx, candidate in enumerate(candidates):
+    for idx in candidate_idxs:
         if idx in used:
             continue
+        candidate = candidates[idx]
         # Try exact match first.
         if needle.heading == candidate.heading:
             return (idx, 1.0)
-        score = _jaccard_similarity(needle.heading, candidate.heading)
+        # Length filter: Jaccard(A, B) <= min(|A|,|B|) / max(|A|,|B|), so pairs
+        # whose sizes differ too much can never beat the current best score
+        # (initially the threshold) and need no set intersection.
+        cand_len = len(candidate.words)
+        if min(needle_len, cand_len) < best_score * max(needle_len, cand_len):
+            continue
+        if candidate_masks is not None and (needle_len or cand_len):
+            inter = (needle_mask & candidate_masks[idx]).bit_count()
+            score = inter / (needle_len + cand_len - inter)
+        else:
+            score = _jaccard_similarity_sets(needle.words, candidate.words)
         if score > best_score:
             best_score = score
             best_idx = idx
@@ -405,8 +516,16 @@ def match_topics(
     # Track which topics in each provider have been assigned to a cluster.
     used: Dict[str, Set[int]] = {p: set() for p in providers}
 
-    # Each cluster: maps provider → Topic (or None), plus the match_method.
-    # Format: {"topics": {provider: Topic|None}, "match_method": str}
+    # Inverted heading-word index per provider, so fuzzy matching only scores
+    # candidates that share a word with the anchor.
+    word_index = {p: _build_word_index(provider_topics[p]) for p in providers}
+    word_masks = _build_word_masks(provider_topics)
+
+    # Each cluster: maps provider → Topic for present providers only (a missing
+    # key means absent), plus the match_method. Anchors are visited in provider
+    # order and only later providers can still join, so insertion order matches
+    # provider order.
+    # Format: {"topics": {provider: Topic}, "match_method": str}
     clusters: List[Dict] = []
 
     # -----------------------------------------------------------------------
@@ -417,8 +536,7 @@ def match_topics(
             if anchor_idx in used[anchor_provider]:
                 continue
 
-            cluster_topics: Dict[str, Optional[Topic]] = {p: None for p in providers}
-            cluster_topics[anchor_provider] = anchor_topic
+            cluster_topics: Dict[str, Topic] = {anchor_provider: anchor_topic}
             used[anchor_provider].add(anchor_idx)
 
             # Provisional method for this cluster — upgraded as matches are found.
@@ -427,8 +545,16 @@ def match_topics(
             for other_provider in providers:
                 if other_provider == anchor_provider:
                     continue
+                # Skip providers whose topics are all claimed already.
+                if len(used[other_provider]) >= len(provider_topics[other_provider]):
+                    continue
                 other_topics = provider_topics[other_provider]
-                result = _best_match(anchor_topic, other_topics, used[other_provider])
+                result = _best_match(
+                    anchor_topic, other_topics, used[other_provider],
+                    word_index=word_index[other_provider],
+                    needle_mask=word_masks[anchor_provider][anchor_idx],
+                    candidate_masks=word_masks[other_provider],
+                )
                 if result is not None:
                     match_idx, score = result
                     cluster_topics[other_provider] = other_topics[match_idx]
@@ -456,21 +582,23 @@ def match_topics(
         cluster_topics = cluster["topics"]
         match_method = cluster["match_method"]
 
-        present_topics = [(p, t) for p, t in cluster_topics.items() if t is not None]
-        canonical = max(
-            (t.heading for _, t in present_topics),
-            key=len,
-        )
-
+        # One pass builds coverage and picks the longest heading as the
+        # canonical name (first provider wins ties, as max() did).
         coverage: Dict[str, str] = {}
+        canonical = ""
+        canonical_len = -1
         for p in providers:
             t = cluster_topics.get(p)
-            if t is not None:
-                coverage[p] = t.coverage
-            else:
+            if t is None:
                 coverage[p] = "absent"
+                continue
+            coverage[p] = t.coverage
+            heading_len = len(t.heading)
+            if heading_len > canonical_len:
+                canonical = t.heading
+                canonical_len = heading_len
 
-        present_count = sum(1 for v in coverage.values() if v != "absent")
+        present_count = len(cluster_topics)
 
         if active_provider_count == 1:
             agreement = f"unique-{providers[0]}"
@@ -479,9 +607,7 @@ def match_topics(
         elif present_count >= 2:
             agreement = "majority"
         else:
-            only_provider = next(
-                p for p, v in coverage.items() if v != "absent"
-            )
+            only_provider = next(iter(cluster_topics))
             agreement = f"unique-{only_provider}"
 
         matched.append(MatchedTopic(
@@ -502,7 +628,24 @@ def _extract_urls(citations: List[Any]) -> Set[str]:
     """Extract normalized URL strings from a citations list.
 
     Handles both dict citations ({"url": "..."}) and bare URL strings.
+
+    Providers emit homogeneous lists, so the type of the first entry picks a
+    set-comprehension fast path. A mismatched entry raises AttributeError
+    there and falls back to the per-item dispatch loop below.
     """
+    if not citations:
+        return set()
+    first = citations[0]
+    try:
+        if isinstance(first, dict):
+            return {c["url"].strip() for c in citations if c.get("url")}
+        if isinstance(first, str):
+            urls = {c.strip() for c in citations}
+            urls.discard("")
+            return urls
+    except AttributeError:
+        pass
+
     urls: Set[str] = set()
     for citation in citations:
         if isinstance(citation, dict):
@@ -517,27 +660,25 @@ def _extract_urls(citations: List[Any]) -> Set[str]:
 
 
 def _compute_citation_overlap(
-    results: list,  # List[ProviderResult]
+    provider_url_sets: List[Tuple[str, Set[str]]],
 ) -> Dict[str, List[str]]:
     """Return a dict of {url: [providers]} for URLs cited by 2+ providers.
 
     Only URLs appearing in 2 or more provider citation lists are included.
 
     Args:
-        results: List of ProviderResult (successful only).
+        provider_url_sets: [(provider, url_set), ...] for successful providers,
+            as computed once by build_matrix() via _extract_urls().
 
     Returns:
         Dict mapping URL → sorted list of provider names.
     """
     # Build {url: set of providers}
-    url_providers: Dict[str, Set[str]] = {}
+    url_providers: Dict[str, Set[str]] = defaultdict(set)
 
-    for r in results:
-        provider_urls = _extract_urls(r.citations)
+    for provider, provider_urls in provider_url_sets:
         for url in provider_urls:
-            if url not in url_providers:
-                url_providers[url] = set()
-            url_providers[url].add(r.provider)
+            url_providers[url].add(provider)
 
     # Filter to only multi-provider URLs, sort provider lists for determinism.
     overlap: Dict[str, List[str]] = {}
@@ -577,18 +718,22 @@ def build_matrix(results: list) -> ComparisonMatrix:
             unmatched_hints=[],
         )
 
-    providers = [r.provider for r in successful]
+    # Provider names key most matrix dicts; intern them once here.
+    providers = [sys.intern(r.provider) for r in successful]
 
     # Extract topics per provider.
     provider_topics: Dict[str, List[Topic]] = {}
-    for r in successful:
-        provider_topics[r.provider] = extract_topics(r.report)
+    for p, r in zip(providers, successful):
+        provider_topics[p] = extract_topics(r.report)
 
     # Match topics across providers (heading-based: exact + fuzzy).
     matched = match_topics(provider_topics)
 
     # Compute citation overlap.
-    citation_overlap = _compute_citation_overlap(successful)
+    # URL sets are normalized once per provider and shared by any consumer.
+    # URLs stay un-interned: they are long and mostly unique.
+    provider_url_sets = [(p, _extract_urls(r.citations)) for p, r in zip(providers, successful)]
+    citation_overlap = _compute_citation_overlap(provider_url_sets)
 
     # Compute stats.
     consensus_count = sum(1 for t in matched if t.agreement_level == "consensus")
@@ -606,11 +751,9 @@ def build_matrix(results: list) -> ComparisonMatrix:
     # Each hint gives the LLM the provider, heading, and top keywords so it
     # can decide whether to manually merge topics with different headings.
     # Build a lookup from heading to Topic for each provider.
-    heading_to_topic: Dict[str, Dict[str, Topic]] = {}
+    heading_to_topic: Dict[str, Dict[str, Topic]] = defaultdict(dict)
     for p, topics_list in provider_topics.items():
         for topic in topics_list:
-            if topic.heading not in heading_to_topic:
-                heading_to_topic[topic.heading] = {}
             heading_to_topic[topic.heading][p] = topic
 
     unmatched_hints: List[Dict] = []
@@ -4,12 +4,14 @@
 a background task that can take up to 30 minutes. We POST with background=true, then
 poll GET /v1/responses/{id} with adaptive intervals: 5s for first 2 min, 15s for
 2-10 min, 30s for 10+ min. Hard timeout at 1800s (30 minutes). Adaptive intervals
-reduce API load while maintaining responsiveness. Fallback model o4-mini-deep-research
+reduce API load while maintaining responsiveness; past 10 minutes polls back off
+further with jitter and use conditional GETs (DEC-OPENAI-POLL-001). Fallback model o4-mini-deep-research
 used if primary model returns 404.
 
 Uses the Responses API (not Chat Completions) as required by deep research models.
 """
 
+import random
 import sys
 import time
 from typing import Any, Dict, List, Optional, Tuple
@@ -21,6 +23,9 @@ BASE_URL = "https://api.openai.com/v1"
 PRIMARY_MODEL = "o3-deep-research-2025-06-26"
 FALLBACK_MODEL = "o4-mini-deep-research-2025-06-26"
 MAX_POLL_SECONDS = 1800  # 30 minute hard ceiling
+POLL_BACKOFF_FACTOR = 1.3  # interval growth per poll after 10 minutes
+POLL_MAX_INTERVAL = 60.0  # backoff cap (seconds)
+POLL_JITTER = 0.2  # +/- fraction applied to backed-off sleeps
 
 
 def _get_poll_interval(elapsed: float) -> int:
@@ -40,6 +45,31 @@ def _get_poll_interval(elapsed: float) -> int:
         return 30
 
 
+# Poll status dispatch. Terminal failures map to their ProviderAPIError message
+# ("failed" prefers the API's own error message when present).
+_TERMINAL_OK = frozenset({"completed"})
+_TERMINAL_FAIL = {
+    "failed": "Unknown error",
+    "incomplete": "returned incomplete (may have hit output limit)",
+    "cancelled": "was cancelled",
+}
+_PROGRESS = frozenset({"queued", "in_progress", "searching"})
+
+
+def _next_poll_interval(elapsed: float, prev: Optional[float]) -> float:
+    """Return the next poll interval, backing off exponentially after 10 minutes.
+
+    Before 600s this is exactly _get_poll_interval(). After that each interval
+    grows by POLL_BACKOFF_FACTOR from the previous one (never below the
+    adaptive 30s floor), capped at POLL_MAX_INTERVAL. Jitter is applied by the
+    caller so it does not compound.
+    """
+    base = _get_poll_interval(elapsed)
+    if elapsed < 600 or prev is None:
+        return float(base)
+    return min(POLL_MAX_INTERVAL, max(float(base), prev * POLL_BACKOFF_FACTOR))
+
+
 def _headers(api_key: str) -> Dict[str, str]:
     return {
         "Authorization": f"Bearer {api_key}",
@@ -71,6 +101,16 @@ def _submit_request(api_key: str, topic: str, model: str) -> Dict[str, Any]:
 def _poll_response(api_key: str, response_id: str) -> Dict[str, Any]:
     """Poll for a completed response.
 
+    @decision DEC-OPENAI-POLL-001
+    @title Conditional GET polling with backoff and jitter after 10 minutes
+    @status accepted
+    @rationale Each poll used to re-download and re-parse the full response
+    object even while nothing had changed. Polls now send If-None-Match with
+    the last ETag; a 304 means the status is unchanged and skips JSON parsing.
+    Past the 10-minute mark, intervals grow by POLL_BACKOFF_FACTOR up to
+    POLL_MAX_INTERVAL with +/-POLL_JITTER so concurrent jobs do not poll in
+    lockstep. Sleeps never overrun MAX_POLL_SECONDS.
+
     Returns:
         Completed response dict.
 
@@ -79,6 +119,11 @@ def _poll_response(api_key: str, response_id: str) -> Dict[str, Any]:
     """
     start_time = time.time()
     poll_count = 0
+    url = f"{BASE_URL}/responses/{response_id}"
+    etag: Optional[str] = None
+    resp: Dict[str, Any] = {}
+    status = ""
+    interval: Optional[float] = None
 
     while True:
         elapsed = time.time() - start_time
@@ -88,39 +133,34 @@ def _poll_response(api_key: str, response_id: str) -> Dict[str, Any]:
             raise ProviderTimeoutError("openai", MAX_POLL_SECONDS, elapsed)
 
         poll_count += 1
-        resp = http.get(
-            f"{BASE_URL}/responses/{response_id}",
-            headers=_headers(api_key),
-            timeout=30,
-        )
-        status = resp.get("status", "")
-        http.log(f"OpenAI poll {poll_count}: status={status}")
-
-        if status == "completed":
+        data, etag = http.get_if_changed(url, etag=etag, headers=_headers(api_key), timeout=30)
+        if data is not None:
+            resp = data
+            status = resp.get("status", "")
+            http.log(f"OpenAI poll {poll_count}: status={status}")
+        else:
+            http.log(f"OpenAI poll {poll_count}: not modified (status={status})")
+
+        if status in _TERMINAL_OK:
             return resp
-        elif status == "failed":
-            error = resp.get("error", {})
-            msg = error.get("message", "Unknown error") if isinstance(error, dict) else str(error)
+        msg = _TERMINAL_FAIL.get(status)
+        if msg is not None:
+            if status == "failed":
+                error = resp.get("error", {})
+                msg = error.get("message", msg) if isinstance(error, dict) else str(error)
             raise ProviderAPIError("openai", 0, msg, elapsed)
-        elif status == "incomplete":
-            raise ProviderAPIError("openai", 0, "returned incomplete (may have hit output limit)", elapsed)
-        elif status == "cancelled":
-            raise ProviderAPIError("openai", 0, "was cancelled", elapsed)
-        elif status in ("queued", "in_progress", "searching"):
-            minutes = int(elapsed) // 60
-            seconds = int(elapsed) % 60
-            sys.stderr.write(f"  [OpenAI] Status: {status} ({minutes}m {seconds}s, poll {poll_count})\n")
-            sys.stderr.flush()
-            interval = _get_poll_interval(elapsed)
-            time.sleep(interval)
-        else:
-            # Unknown status, keep polling
-            minutes = int(elapsed) // 60
-            seconds = int(elapsed) % 60
-            sys.stderr.write(f"  [OpenAI] Unknown status: {status} ({minutes}m {seconds}s, poll {poll_count})\n")
-            sys.stderr.flush()
-            interval = _get_poll_interval(elapsed)
-            time.sleep(interval)
+
+        # Queued/in-progress, or an unknown status: keep polling
+        label = "Status" if status in _PROGRESS else "Unknown status"
+        minutes = int(elapsed) // 60
+        seconds = int(elapsed) % 60
+        sys.stderr.write(f"  [OpenAI] {label}: {status} ({minutes}m {seconds}s, poll {poll_count})\n")
+        sys.stderr.flush()
+        interval = _next_poll_interval(elapsed, interval)
+        delay = interval
+        if elapsed >= 600:
+            delay *= random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+        time.sleep(max(0.0, min(delay, MAX_POLL_SECONDS - elapsed)))
 
 
 def _extract_report(response: Dict[str, Any]) -> Tuple[str, List[Any]]:
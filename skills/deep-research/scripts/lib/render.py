@@ -9,8 +9,8 @@ Provides ProviderResult dataclass and output formatters (JSON, compact).
 """
 
 import json
-from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, TextIO
 
 
 @dataclass
@@ -35,78 +35,120 @@ class ProviderResult:
     error: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to JSON-serializable dict."""
-        return asdict(self)
+        """Convert to JSON-serializable dict.
+
+        Built by hand rather than with dataclasses.asdict(), which deep-copies
+        every citation dict. The returned dict shares the citations list with
+        this result; callers serialize it and must not mutate it.
+        """
+        return {
+            "provider": self.provider,
+            "success": self.success,
+            "report": self.report,
+            "citations": self.citations,
+            "model": self.model,
+            "elapsed_seconds": self.elapsed_seconds,
+            "error": self.error,
+        }
 
 
-def render_json(
+def _build_output(
     results: List[ProviderResult],
     topic: str,
-    comparison_matrix: Optional[Dict[str, Any]] = None,
-) -> str:
-    """Render results as structured JSON for Claude consumption.
-
-    Args:
-        results: Provider results to serialize.
-        topic: Research topic string.
-        comparison_matrix: Optional pre-built matrix dict (from ComparisonMatrix.to_dict()).
-            When present, embedded under the 'comparison_matrix' key so the
-            synthesis step can consume it without re-deriving it.
-    """
+    comparison_matrix: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Assemble the JSON output document shared by render_json() and write_json()."""
+    # One pass over results and their citations collects warnings, result
+    # dicts and validation counts together.
     warnings: List[str] = []
+    result_dicts: List[Dict[str, Any]] = []
+    success_count = 0
+    validation_depth = 0
+    counts = {"total": 0, "valid": 0, "invalid": 0, "unreachable": 0, "skipped": 0}
+
     for r in results:
-        if not r.success:
+        result_dicts.append(r.to_dict())
+        if r.success:
+            success_count += 1
+        else:
             elapsed = f" (after {r.elapsed_seconds}s)" if r.elapsed_seconds else ""
             warnings.append(f"{r.provider} failed: {r.error or 'unknown error'}{elapsed}")
 
+        depth = 0
+        for citation in r.citations:
+            if isinstance(citation, dict) and "validation" in citation:
+                val = citation["validation"]
+                if not depth:
+                    depth = val.get("depth", 0)
+                counts["total"] += 1
+                status = val.get("status", "")
+                if status in counts and status != "total":
+                    counts[status] += 1
+        if depth > validation_depth:
+            validation_depth = depth
+
     output: Dict[str, Any] = {
         "topic": topic,
         "provider_count": len(results),
-        "success_count": sum(1 for r in results if r.success),
+        "success_count": success_count,
         "warnings": warnings,
-        "results": [r.to_dict() for r in results],
+        "results": result_dicts,
     }
 
     # Add citation validation summary if any citations have validation data
-    validation_depth = 0
-    total = 0
-    valid = 0
-    invalid = 0
-    unreachable = 0
-    skipped = 0
-
-    for r in results:
-        citations = r.citations
-        for citation in citations:
-            if isinstance(citation, dict) and "validation" in citation:
-                val = citation["validation"]
-                validation_depth = val.get("depth", 0)
-                total += 1
-                status = val.get("status", "")
-                if status == "valid":
-                    valid += 1
-                elif status == "invalid":
-                    invalid += 1
-                elif status == "unreachable":
-                    unreachable += 1
-                elif status == "skipped":
-                    skipped += 1
-
     if validation_depth > 0:
-        output["citation_validation"] = {
-            "depth": validation_depth,
-            "total": total,
-            "valid": valid,
-            "invalid": invalid,
-            "unreachable": unreachable,
-            "skipped": skipped,
-        }
+        output["citation_validation"] = {"depth": validation_depth, **counts}
 
     # Embed pre-built comparison matrix when provided.
     if comparison_matrix is not None:
         output["comparison_matrix"] = comparison_matrix
 
-    return json.dumps(output, indent=2, ensure_ascii=False)
+    return output
+
+
+def write_json(
+    fp: TextIO,
+    results: List[ProviderResult],
+    topic: str,
+    comparison_matrix: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Serialize results as JSON straight into a text file object.
+
+    @decision DEC-RENDER-STREAM-001
+    @title Stream JSON output with json.dump instead of materializing a string
+    @status accepted
+    @rationale Reports run to several MB each. json.dumps() joins every
+    encoded chunk into one large string before the caller writes it, so the
+    document briefly exists twice (dict + string). json.dump() hands chunks to
+    fp.write() as they are produced, keeping peak memory at the dict alone.
+    orjson would be faster still but this skill is stdlib-only.
+
+    Args:
+        fp: Writable text file object (e.g. an open file or sys.stdout).
+        results, topic, comparison_matrix: As for render_json().
+    """
+    json.dump(_build_output(results, topic, comparison_matrix), fp,
+              indent=2, ensure_ascii=False)
+
+
+def render_json(
+    results: List[ProviderResult],
+    topic: str,
+    comparison_matrix: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Render results as structured JSON for Claude consumption.
+
+    Prefer write_json() when the output goes to a file (DEC-RENDER-STREAM-001).
+
+    Args:
+        results: Provider results to serialize.
+        topic: Research topic string.
+        comparison_matrix: Optional pre-built matrix dict (from ComparisonMatrix.to_dict()).
+            When present, embedded under the 'comparison_matrix' key so the
+            synthesis step can consume it without re-deriving it.
+    """
+    return json.dumps(_build_output(results, topic, comparison_matrix),
+                      indent=2, ensure_ascii=False)
 
 
 def render_compact(results: List[ProviderResult], topic: str) -> str:
@@ -0,0 +1,45 @@
+"""Shared pytest fixtures for the deep-research test suite.
+
+@decision Source-inspection tests (test_gemini_stream.py) read and parse
+scripts/lib/gemini_dr.py once per session through the gemini_source fixture
+instead of re-opening and re-parsing the file in every test.
+
+scripts/ is added to sys.path here, once, before any test module is collected,
+so every module imports the same lib package. The unittest modules keep their
+own insert so they still run standalone via their __main__ blocks.
+"""
+
+import ast
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+SCRIPT_DIR = Path(__file__).parent.parent / "scripts"
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+GEMINI_DR_PATH = SCRIPT_DIR / "lib" / "gemini_dr.py"
+
+
+@pytest.fixture(scope="session")
+def gemini_source() -> SimpleNamespace:
+    """gemini_dr.py as source text, parsed module, and top-level function nodes/source by name.
+
+    func_source holds each function's full lines (def through last body line),
+    sliced from one split of the file rather than an ast.get_source_segment()
+    call per test, which re-splits the whole source every time.
+    """
+    source = GEMINI_DR_PATH.read_text()
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    # Only module-level functions are inspected, so the index covers the
+    # module's direct children instead of walking every expression node.
+    func_by_name = {
+        node.name: node for node in ast.iter_child_nodes(tree) if isinstance(node, ast.FunctionDef)
+    }
+    func_source = {
+        name: "".join(lines[node.lineno - 1:node.end_lineno]) for name, node in func_by_name.items()
+    }
+    return SimpleNamespace(source=source, tree=tree, func_by_name=func_by_name, func_source=func_source)
@@ -16,152 +16,107 @@ _format_thinking_line, _get_poll_interval) and verifies constants/function exist
 and structural correctness in source files.
 """
 
-import ast
 import http.server
 import inspect
-import os
-import sys
+import re
+import socket
 import threading
 import time
-from pathlib import Path
 
-# Add scripts to path for imports (like test_warnings.py does)
-SCRIPT_DIR = Path(__file__).parent.parent / "scripts"
-sys.path.insert(0, str(SCRIPT_DIR))
+import pytest
+
+# scripts/ is put on sys.path once per session by conftest.py
 
 from lib.http import _parse_sse_lines, stream_sse
 from lib.gemini_dr import (
+    _extract_report,
     _format_thinking_line,
     _get_poll_interval,
+    _PollController,
+    POLL_MAX_INTERVAL,
     ZOMBIE_THRESHOLD,
+    MAX_INLINE_CITATIONS,
     MAX_TIMEOUT_SECONDS,
     SSE_READ_TIMEOUT,
 )
 
 
+def _event(event="", data="", id=""):
+    return {"event": event, "data": data, "id": id}
+
+
+# (id, lines, expected events) — one entry per parsing rule.
+SSE_CASES = [
+    pytest.param(
+        ["event: test\n", "data: hello\n", "id: 123\n", "\n"],
+        [_event("test", "hello", "123")],
+        id="single_event_all_fields",
+    ),
+    pytest.param(
+        # Multi-line data fields are concatenated with newlines
+        ["event: content\n", "data: first line\n", "data: second line\n", "data: third line\n", "\n"],
+        [_event("content", "first line\nsecond line\nthird line")],
+        id="multiline_data",
+    ),
+    pytest.param(
+        # Comment lines (starting with :) are skipped
+        [": this is a comment\n", "event: test\n", "data: hello\n", ": another comment\n", "\n"],
+        [_event("test", "hello")],
+        id="comment_lines_ignored",
+    ),
+    pytest.param(
+        # Blank lines with no preceding fields produce no events
+        ["\n", "\n", "event: test\n", "data: hello\n", "\n", "\n"],
+        [_event("test", "hello")],
+        id="empty_events_skipped",
+    ),
+    pytest.param(
+        # Missing fields are empty strings
+        ["data: only data\n", "\n", "event: only event\n", "\n", "id: only id\n", "\n"],
+        [_event(data="only data"), _event(event="only event"), _event(id="only id")],
+        id="missing_fields",
+    ),
+    pytest.param(
+        ["event: test\n", "data: hello\n"],
+        [_event("test", "hello")],
+        id="no_trailing_blank_line",
+    ),
+    pytest.param(
+        # SSE spec: a single leading space after the colon is stripped
+        ["event: test\n", "data: hello\n", "id:  123\n", "\n"],
+        [_event("test", "hello", " 123")],
+        id="leading_space_stripped",
+    ),
+    pytest.param(
+        # SSE spec: a field name with no colon has an empty value
+        ["data\n", "data: second\n", "id\n", "\n"],
+        [_event(data="\nsecond")],
+        id="field_without_colon",
+    ),
+    pytest.param(
+        [
+            "event: first\n", "data: first data\n", "\n",
+            "event: second\n", "data: second data\n", "\n",
+            "event: third\n", "data: third data\n", "\n",
+        ],
+        [_event("first", "first data"), _event("second", "second data"), _event("third", "third data")],
+        id="multiple_events",
+    ),
+]
+
+
 class TestSSELineParsing:
     """Test SSE line parsing logic."""
 
-    def test_single_event_all_fields(self):
-        """Parse a single complete SSE event with all fields."""
-        lines = [
-            "event: test\n",
-            "data: hello\n",
-            "id: 123\n",
-            "\n",
-        ]
-        events = _parse_sse_lines(lines)
-        assert len(events) == 1
-        assert events[0]["event"] == "test"
-        assert events[0]["data"] == "hello"
-        assert events[0]["id"] == "123"
-
-    def test_multiline_data(self):
-        """Parse multi-line data fields (concatenated with newlines)."""
-        lines = [
-            "event: content\n",
-            "data: first line\n",
-            "data: second line\n",
-            "data: third line\n",
-            "\n",
-        ]
-        events = _parse_sse_lines(lines)
-        assert len(events) == 1
-        assert events[0]["event"] == "content"
-        assert events[0]["data"] == "first line\nsecond line\nthird line"
-        assert events[0]["id"] == ""
-
-    def test_comment_lines_ignored(self):
-        """Comment lines (starting with :) should be skipped."""
-        lines = [
-            ": this is a comment\n",
-            "event: test\n",
-            "data: hello\n",
-            ": another comment\n",
-            "\n",
-        ]
-        events = _parse_sse_lines(lines)
-        assert len(events) == 1
-        assert events[0]["event"] == "test"
-        assert events[0]["data"] == "hello"
-
-    def test_empty_events_skipped(self):
-        """Blank lines with no preceding fields should not produce events."""
-        lines = [
-            "\n",
-            "\n",
-            "event: test\n",
-            "data: hello\n",
-            "\n",
-            "\n",
-        ]
-        events = _parse_sse_lines(lines)
-        assert len(events) == 1
-        assert events[0]["event"] == "test"
-        assert events[0]["data"] == "hello"
-
-    def test_missing_fields(self):
-        """Events with missing fields should have empty strings for those fields."""
-        lines = [
-            "data: only data\n",
-            "\n",
-            "event: only event\n",
-            "\n",
-            "id: only id\n",
-            "\n",
-        ]
-        events = _parse_sse_lines(lines)
-        assert len(events) == 3
-        assert events[0] == {"event": "", "data": "only data", "id": ""}
-        assert events[1] == {"event": "only event", "data": "", "id": ""}
-        assert events[2] == {"event": "", "data": "", "id": "only id"}
-
-    def test_no_trailing_blank_line(self):
-        """Parser should handle lines without trailing blank line."""
-        lines = [
-            "event: test\n",
-            "data: hello\n",
-        ]
-        events = _parse_sse_lines(lines)
-        assert len(events) == 1
-        assert events[0]["event"] == "test"
-        assert events[0]["data"] == "hello"
-
-    def test_leading_space_stripped(self):
-        """SSE spec: single leading space after colon is stripped."""
-        lines = [
-            "event: test\n",
-            "data: hello\n",  # Single space after colon
-            "id:  123\n",  # Two spaces - only first is stripped
-            "\n",
-        ]
-        events = _parse_sse_lines(lines)
-        assert len(events) == 1
-        assert events[0]["event"] == "test"
-        assert events[0]["data"] == "hello"
-        assert events[0]["id"] == " 123"  # Second space preserved
-
-    def test_multiple_events(self):
-        """Parse multiple events in sequence."""
-        lines = [
-            "event: first\n",
-            "data: first data\n",
-            "\n",
-            "event: second\n",
-            "data: second data\n",
-            "\n",
-            "event: third\n",
-            "data: third data\n",
-            "\n",
-        ]
-        events = _parse_sse_lines(lines)
-        assert len(events) == 3
-        assert events[0]["event"] == "first"
-        assert events[0]["data"] == "first data"
-        assert events[1]["event"] == "second"
-        assert events[1]["data"] == "second data"
-        assert events[2]["event"] == "third"
-        assert events[2]["data"] == "third data"
+    @pytest.mark.parametrize("lines,expected", SSE_CASES)
+    def test_parse_sse_lines(self, lines, expected):
+        assert _parse_sse_lines(lines) == expected
+
+    @pytest.mark.parametrize("lines,expected", SSE_CASES)
+    def test_whole_buffer_matches_line_list(self, lines, expected):
+        """The same stream as one buffer split with splitlines() parses identically."""
+        whole = "".join(lines).splitlines(keepends=True)
+        assert _parse_sse_lines(whole) == _parse_sse_lines(lines) == expected
 
 
 class TestThinkingSummaryFormat:
@@ -197,6 +152,21 @@ class TestThinkingSummaryFormat:
         assert "..." not in line
 
 
+class TestInlineCitations:
+    """Test the inline-URL fallback in _extract_report."""
+
+    def test_dedup_preserves_order(self):
+        report = "See (https://a.example/x) and [b](https://b.example) then https://a.example/x again."
+        _, citations = _extract_report({"outputs": [{"text": report}]})
+        assert [c["url"] for c in citations] == ["https://a.example/x", "https://b.example"]
+
+    def test_citation_cap(self):
+        report = " ".join(f"https://site{i}.example/" for i in range(MAX_INLINE_CITATIONS + 50))
+        _, citations = _extract_report({"outputs": [{"text": report}]})
+        assert len(citations) == MAX_INLINE_CITATIONS
+        assert citations[-1]["url"] == f"https://site{MAX_INLINE_CITATIONS - 1}.example/"
+
+
 class TestPollInterval:
     """Test adaptive poll interval function."""
 
@@ -219,6 +189,30 @@ class TestPollInterval:
         assert _get_poll_interval(1800.0) == 30.0
 
 
+class TestPollController:
+    """Test AIMD poll pacing (DEC-POLL-AIMD-001)."""
+
+    def test_unchanged_progress_backs_off(self):
+        pacing = _PollController()
+        snap = ("in_progress", 0, 0)
+        assert pacing.next_interval(10, snap) == 5.0
+        assert pacing.next_interval(15, snap) == 7.5
+        assert pacing.next_interval(22, snap) == 11.25
+
+    def test_backoff_is_capped(self):
+        pacing = _PollController()
+        snap = ("in_progress", 0, 0)
+        for _ in range(20):
+            interval = pacing.next_interval(700, snap)
+        assert interval == POLL_MAX_INTERVAL
+
+    def test_progress_resets_to_baseline(self):
+        pacing = _PollController()
+        pacing.next_interval(10, ("in_progress", 1, 100))
+        pacing.next_interval(20, ("in_progress", 1, 100))
+        assert pacing.next_interval(300, ("in_progress", 1, 250)) == 15.0
+
+
 class TestConstants:
     """Test that required constants have expected values."""
 
@@ -231,93 +225,59 @@ class TestConstants:
         assert MAX_TIMEOUT_SECONDS == 1800
 
 
+# Payload keys _submit_request must (or must not) send, single- or double-quoted
+_PAYLOAD_KEY_RE = re.compile(r"""["'](background|input|agent|stream|agent_config)["']""")
+
+
 class TestStreamingPayload:
     """Test that _submit_request uses correct POST payload structure."""
 
-    def test_submit_request_background_only(self):
+    def test_submit_request_background_only(self, gemini_source):
         """Verify _submit_request creates interaction with background=True only.
 
         The POST request should include only input, agent, and background=True.
         Streaming is retrieved separately via GET with ?alt=sse parameter.
         Including stream=True or agent_config in POST body causes HTTP 400.
         """
-        # Read the source file
-        gemini_dr_path = os.path.join(
-            os.path.dirname(__file__), '..', 'scripts', 'lib', 'gemini_dr.py'
-        )
-        with open(gemini_dr_path, 'r') as f:
-            source = f.read()
-
-        # Parse AST to find _submit_request function
-        tree = ast.parse(source)
-
-        submit_func = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name == "_submit_request":
-                submit_func = node
-                break
+        # Source of just this function
+        func_source = gemini_source.func_source.get("_submit_request")
+        assert func_source is not None, "_submit_request function not found"
 
-        assert submit_func is not None, "_submit_request function not found"
-
-        # Get the source of just this function
-        func_source = ast.get_source_segment(source, submit_func)
-        assert func_source is not None
+        # Quoted payload keys, collected in one scan of the function source
+        found = set(_PAYLOAD_KEY_RE.findall(func_source))
 
         # Check that payload includes required keys
-        assert '"background"' in func_source or "'background'" in func_source
-        assert '"input"' in func_source or "'input'" in func_source
-        assert '"agent"' in func_source or "'agent'" in func_source
+        assert {"background", "input", "agent"} <= found, \
+            f"missing payload keys: {sorted({'background', 'input', 'agent'} - found)}"
 
         # Check that stream and agent_config are NOT in the POST body
         # (they cause HTTP 400 errors)
-        assert '"stream"' not in func_source and "'stream'" not in func_source
-        assert '"agent_config"' not in func_source and "'agent_config'" not in func_source
+        assert not found & {"stream", "agent_config"}, \
+            f"forbidden payload keys: {sorted(found & {'stream', 'agent_config'})}"
 
 
 class TestFallbackExists:
     """Test that polling fallback function exists."""
 
-    def test_poll_response_fallback_exists(self):
+    def test_poll_response_fallback_exists(self, gemini_source):
         """Verify _poll_response_fallback function exists in gemini_dr module."""
-        gemini_dr_path = os.path.join(
-            os.path.dirname(__file__), '..', 'scripts', 'lib', 'gemini_dr.py'
-        )
-        with open(gemini_dr_path, 'r') as f:
-            source = f.read()
-
-        assert "_poll_response_fallback" in source, \
-            "_poll_response_fallback function not found in source"
-
-        # Parse AST to confirm it's a function definition
-        tree = ast.parse(source)
-        func_names = [
-            node.name for node in ast.walk(tree)
-            if isinstance(node, ast.FunctionDef)
-        ]
-        assert "_poll_response_fallback" in func_names
+        # func_by_name indexes the module's top-level functions (gemini_source fixture)
+        assert "_poll_response_fallback" in gemini_source.func_by_name, \
+            "_poll_response_fallback function definition not found in gemini_dr.py"
 
 
 class TestStreamResponseExists:
     """Test that SSE streaming function exists."""
 
-    def test_stream_response_exists(self):
+    def test_stream_response_exists(self, gemini_source):
         """Verify _stream_response function exists in gemini_dr module."""
-        gemini_dr_path = os.path.join(
-            os.path.dirname(__file__), '..', 'scripts', 'lib', 'gemini_dr.py'
-        )
-        with open(gemini_dr_path, 'r') as f:
-            source = f.read()
+        # func_by_name indexes the module's top-level functions (gemini_source fixture)
+        assert "_stream_response" in gemini_source.func_by_name, \
+            "_stream_response function definition not found in gemini_dr.py"
 
-        assert "_stream_response" in source, \
-            "_stream_response function not found in source"
 
-        # Parse AST to confirm it's a function definition
-        tree = ast.parse(source)
-        func_names = [
-            node.name for node in ast.walk(tree)
-            if isinstance(node, ast.FunctionDef)
-        ]
-        assert "_stream_response" in func_names
+# Built once; the read_timeout tests below only inspect it.
+_STREAM_SSE_SIG = inspect.signature(stream_sse)
 
 
 class TestStreamSSEReadTimeout:
@@ -335,8 +295,7 @@ class TestStreamSSEReadTimeout:
         This is the primary fix: the parameter must exist so callers can set
         a per-read timeout separate from the connection timeout.
         """
-        sig = inspect.signature(stream_sse)
-        assert "read_timeout" in sig.parameters, (
+        assert "read_timeout" in _STREAM_SSE_SIG.parameters, (
             "stream_sse() must have a read_timeout parameter "
             "(needed for zombie detection — see DEC-TIMEOUT-007)"
         )
@@ -346,8 +305,7 @@ class TestStreamSSEReadTimeout:
 
         Existing callers that don't pass read_timeout must not break.
         """
-        sig = inspect.signature(stream_sse)
-        param = sig.parameters["read_timeout"]
+        param = _STREAM_SSE_SIG.parameters["read_timeout"]
         assert param.default is not inspect.Parameter.empty, (
             "read_timeout must have a default value so existing callers "
             "don't break"
@@ -355,8 +313,7 @@ class TestStreamSSEReadTimeout:
 
     def test_stream_sse_read_timeout_default_is_none_or_positive(self):
         """The default read_timeout must be None or a positive integer/float."""
-        sig = inspect.signature(stream_sse)
-        default = sig.parameters["read_timeout"].default
+        default = _STREAM_SSE_SIG.parameters["read_timeout"].default
         if default is not None:
             assert isinstance(default, (int, float)) and default > 0, (
                 f"read_timeout default must be None or positive, got {default!r}"
@@ -408,90 +365,108 @@ class TestDeadZombieCodeRemoved:
     It should be removed in favour of the socket-level read_timeout.
     """
 
-    def _get_stream_response_source(self) -> str:
-        gemini_dr_path = os.path.join(
-            os.path.dirname(__file__), '..', 'scripts', 'lib', 'gemini_dr.py'
-        )
-        with open(gemini_dr_path, 'r') as f:
-            source = f.read()
-
-        tree = ast.parse(source)
-        stream_func = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name == "_stream_response":
-                stream_func = node
-                break
-
-        assert stream_func is not None, "_stream_response function not found"
-        func_source = ast.get_source_segment(source, stream_func)
-        assert func_source is not None
+    @staticmethod
+    def _get_stream_response_source(gemini_source) -> str:
+        func_source = gemini_source.func_source.get("_stream_response")
+        assert func_source is not None, "_stream_response function not found"
         return func_source
 
-    def test_no_silence_duration_check_in_loop(self):
+    def test_no_silence_duration_check_in_loop(self, gemini_source):
         """The silence_duration zombie check must be removed from _stream_response.
 
         This variable was assigned and checked inside the for-event loop, making it
         dead code: it was never > 0 when events were arriving. The fix replaces it
         with a socket-level read_timeout in stream_sse().
         """
-        func_source = self._get_stream_response_source()
+        func_source = self._get_stream_response_source(gemini_source)
         assert "silence_duration" not in func_source, (
             "silence_duration zombie check found in _stream_response — "
             "this is dead code that must be removed (see DEC-TIMEOUT-007). "
             "Use read_timeout in stream_sse() instead."
         )
 
-    def test_stream_response_uses_read_timeout(self):
+    def test_stream_response_uses_read_timeout(self, gemini_source):
         """_stream_response must pass read_timeout to stream_sse().
 
         The socket read_timeout is the replacement for dead zombie detection.
         """
-        func_source = self._get_stream_response_source()
+        func_source = self._get_stream_response_source(gemini_source)
         assert "read_timeout" in func_source, (
             "_stream_response must pass read_timeout= to http.stream_sse() "
             "to enable socket-level zombie detection (see DEC-TIMEOUT-007)"
         )
 
 
-class _StallingSSEHandler(http.server.BaseHTTPRequestHandler):
-    """Local HTTP handler that sends N SSE events then goes silent.
+_SSE_PREAMBLE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/event-stream\r\n"
+    b"Cache-Control: no-cache\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+)
 
-    Used by TestStreamSSESocketTimeout to exercise the actual socket-level
-    read timeout path in stream_sse() (DEC-TIMEOUT-007).
 
-    Class attributes set before each test:
-        events_to_send  — list of raw SSE event byte strings to write
-        stop_event      — threading.Event; handler polls it so server.shutdown()
-                          is not blocked waiting for a long sleep() to finish
-    """
+# Complete responses (preamble + events) for the stall tests, built once.
+_RESPONSE_TWO_CHUNKS = _SSE_PREAMBLE + (
+    b"event: chunk\ndata: {\"text\": \"hello\"}\n\n"
+    b"event: chunk\ndata: {\"text\": \"world\"}\n\n"
+)
+_RESPONSE_THREE_EVENTS = _SSE_PREAMBLE + (
+    b"event: start\ndata: {\"seq\": 1}\n\n"
+    b"event: middle\ndata: {\"seq\": 2}\n\n"
+    b"event: end\ndata: {\"seq\": 3}\n\n"
+)
+_RESPONSE_CLEAN_EOF = _SSE_PREAMBLE + (
+    b"event: data\ndata: {\"ok\": true}\n\n"
+    b"event: data\ndata: {\"ok\": true}\n\n"
+)
 
-    events_to_send: list = []
-    stop_event: threading.Event = threading.Event()
 
-    def log_message(self, fmt, *args):  # suppress default stderr noise
-        pass
+def _raw_sse_server(response: bytes, stall: bool = True):
+    """Serve one SSE response from a bare listening socket, then optionally stall.
 
-    def do_GET(self):
-        self.send_response(200)
-        self.send_header("Content-Type", "text/event-stream")
-        self.send_header("Cache-Control", "no-cache")
-        # Always send Connection: close so the TCP connection is torn down when
-        # the handler returns. This gives readline() a clean EOF in the happy-
-        # path test, and also means the zombie tests truly exercise "open
-        # connection, no data" rather than a keep-alive race.
-        self.send_header("Connection", "close")
-        self.end_headers()
+    Used by TestStreamSSESocketTimeout to exercise the actual socket-level
+    read timeout path in stream_sse() (DEC-TIMEOUT-007). A background thread
+    accepts a single connection, drains the request headers, and writes the
+    prebuilt response (preamble plus every event) in one sendall(). With stall=True it
+    then keeps the connection open, sending nothing, until stop_event is set
+    — the zombie case. Connection: close plus closing the socket gives the
+    clean-EOF case a proper end of stream. No http.server machinery is
+    involved, so startup and teardown cost one socket each.
+
+    Returns (listener, port, stop_event). Call stop_event.set() then
+    listener.close() when done.
+    """
+    stop_event = threading.Event()
+    if not stall:
+        stop_event.set()  # pre-set: close immediately after the events
+    # Exactly one client connects, so a backlog of 1 suffices. create_server()
+    # already sets SO_REUSEADDR; SO_REUSEPORT is left off, since on an ephemeral
+    # port it could only let a parallel test bind the same port.
+    listener = socket.create_server(("127.0.0.1", 0), backlog=1)
+
+    def serve_once():
         try:
-            for event_bytes in self.__class__.events_to_send:
-                self.wfile.write(event_bytes)
-                self.wfile.flush()
-            # Keep the connection open but send nothing more — the zombie case.
-            # Poll stop_event in small increments so server.shutdown() unblocks
-            # quickly once the client has disconnected and the test is done.
-            while not self.__class__.stop_event.wait(timeout=0.1):
-                pass
-        except (BrokenPipeError, ConnectionResetError):
-            pass  # client disconnected (timeout fired) — expected
+            conn, _addr = listener.accept()
+        except OSError:
+            return  # listener closed before a client connected
+        with conn:
+            request = b""
+            while b"\r\n\r\n" not in request:
+                chunk = conn.recv(4096)
+                if not chunk:
+                    return
+                request += chunk
+            try:
+                # One write for the whole response: per-event flushes could be
+                # held back by Nagle and make the pre-stall event count racy.
+                conn.sendall(response)
+                stop_event.wait()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # client disconnected (timeout fired) — expected
+
+    threading.Thread(target=serve_once, daemon=True).start()
+    return listener, listener.getsockname()[1], stop_event
 
 
 class TestStreamSSESocketTimeout:
@@ -521,35 +496,6 @@ class TestStreamSSESocketTimeout:
 
     # ------------------------------------------------------------------ helpers
 
-    @staticmethod
-    def _start_stalling_server(events: list, stall: bool = True):
-        """Start a stalling SSE server on a random port.
-
-        Args:
-            events: SSE event byte strings the handler sends before stalling.
-            stall:  If True, the handler keeps the connection open (zombie case).
-                    If False, the handler closes after sending events (clean-EOF).
-
-        Returns (server, port, stop_event).
-        Call stop_event.set() then server.shutdown() in the finally block.
-        stop_event.set() unblocks the handler's stall loop so server.shutdown()
-        returns promptly rather than waiting for the full stall duration.
-        """
-        stop_event = threading.Event()
-        if not stall:
-            stop_event.set()  # pre-set: handler exits immediately after events
-
-        _StallingSSEHandler.events_to_send = events
-        _StallingSSEHandler.stop_event = stop_event
-
-        server = http.server.HTTPServer(("127.0.0.1", 0), _StallingSSEHandler)
-        port = server.server_address[1]
-        thread = threading.Thread(target=server.serve_forever, daemon=True)
-        thread.start()
-        # Brief pause so the server socket is ready before we connect.
-        time.sleep(0.05)
-        return server, port, stop_event
-
     @staticmethod
     def _collect_events_with_timeout(url: str, read_timeout: float):
         """Call stream_sse() and collect events until timeout or error.
@@ -572,27 +518,23 @@ class TestStreamSSESocketTimeout:
     def test_stall_raises_within_read_timeout(self):
         """stream_sse() raises when the server stalls mid-stream.
 
-        The server sends 2 valid events then goes silent. With read_timeout=1s
-        the call must raise within ~2s total (generous headroom for CI latency).
+        The server sends 2 valid events then goes silent. With read_timeout=0.2s
+        the call must raise within 0.8s total (generous headroom for CI latency).
         Without the fix the call would block for the full connection timeout
         (30s default) or indefinitely.
         """
-        read_timeout = 1.0          # short so the test runs fast
+        read_timeout = 0.2          # short so the test runs fast
         max_allowed = read_timeout * 4  # generous: allows 4x for slow CI
 
-        events = [
-            b"event: chunk\ndata: {\"text\": \"hello\"}\n\n",
-            b"event: chunk\ndata: {\"text\": \"world\"}\n\n",
-        ]
-        server, port, stop_event = self._start_stalling_server(events, stall=True)
+        listener, port, stop_event = _raw_sse_server(_RESPONSE_TWO_CHUNKS, stall=True)
         try:
             url = f"http://127.0.0.1:{port}/"
             received, exc, elapsed = self._collect_events_with_timeout(
                 url, read_timeout=read_timeout
             )
         finally:
-            stop_event.set()   # unblock handler stall loop before shutdown
-            server.shutdown()
+            stop_event.set()   # release the stalled server thread before closing
+            listener.close()
 
         # Must have received the pre-stall events
         assert len(received) == 2, (
@@ -627,23 +569,18 @@ class TestStreamSSESocketTimeout:
         Exercises the buffering and parse path across multiple event boundaries,
         not just the first one.
         """
-        read_timeout = 1.0
+        read_timeout = 0.2
         max_allowed = read_timeout * 4
 
-        events = [
-            b"event: start\ndata: {\"seq\": 1}\n\n",
-            b"event: middle\ndata: {\"seq\": 2}\n\n",
-            b"event: end\ndata: {\"seq\": 3}\n\n",
-        ]
-        server, port, stop_event = self._start_stalling_server(events, stall=True)
+        listener, port, stop_event = _raw_sse_server(_RESPONSE_THREE_EVENTS, stall=True)
         try:
             url = f"http://127.0.0.1:{port}/"
             received, exc, elapsed = self._collect_events_with_timeout(
                 url, read_timeout=read_timeout
             )
         finally:
-            stop_event.set()   # unblock handler stall loop before shutdown
-            server.shutdown()
+            stop_event.set()   # release the stalled server thread before closing
+            listener.close()
 
         assert len(received) == 3, (
             f"Expected 3 events before stall, got {len(received)}: {received}"
@@ -667,11 +604,7 @@ class TestStreamSSESocketTimeout:
         sends events and closes the connection cleanly (no zombie, no timeout).
         """
         # Server sends 2 events then closes immediately (stall=False)
-        events = [
-            b"event: data\ndata: {\"ok\": true}\n\n",
-            b"event: data\ndata: {\"ok\": true}\n\n",
-        ]
-        server, port, stop_event = self._start_stalling_server(events, stall=False)
+        listener, port, stop_event = _raw_sse_server(_RESPONSE_CLEAN_EOF, stall=False)
         try:
             url = f"http://127.0.0.1:{port}/"
             received, exc, elapsed = self._collect_events_with_timeout(
@@ -679,7 +612,7 @@ class TestStreamSSESocketTimeout:
             )
         finally:
             stop_event.set()   # already set, harmless no-op; keeps pattern consistent
-            server.shutdown()
+            listener.close()
 
         assert exc is None, (
             f"stream_sse() raised unexpectedly on clean EOF: {exc}"
@@ -687,3 +620,58 @@ class TestStreamSSESocketTimeout:
         assert len(received) == 2, (
             f"Expected 2 events from clean server close, got {len(received)}"
         )
+
+
+class _ResumingSSEHandler(http.server.BaseHTTPRequestHandler):
+    """Serves a Gemini-style stream split across two connections.
+
+    The first connection sends a start event and one text delta (id 1), then
+    closes without interaction.complete. The second connection records the
+    Last-Event-ID header it receives and sends the rest of the report.
+    """
+
+    last_event_ids: list = []
+
+    FIRST = (
+        b"event: interaction.start\ndata: {}\n\n"
+        b"event: content.delta\nid: 1\ndata: {\"type\": \"text\", \"text\": \"Hello \"}\n\n"
+    )
+    SECOND = (
+        b"event: content.delta\nid: 2\ndata: {\"type\": \"text\", \"text\": \"world\"}\n\n"
+        b"event: interaction.complete\nid: 3\n"
+        b"data: {\"sources\": [{\"url\": \"https://a.example\", \"title\": \"A\"}]}\n\n"
+    )
+
+    def log_message(self, fmt, *args):  # suppress default stderr noise
+        pass
+
+    def do_GET(self):
+        ids = self.__class__.last_event_ids
+        ids.append(self.headers.get("Last-Event-ID"))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(self.FIRST if len(ids) == 1 else self.SECOND)
+
+
+class TestStreamResume:
+    """_stream_response() reconnects with Last-Event-ID after a dropped stream."""
+
+    def test_resume_continues_report(self, monkeypatch):
+        from lib import gemini_dr
+
+        _ResumingSSEHandler.last_event_ids = []
+        server = http.server.HTTPServer(("127.0.0.1", 0), _ResumingSSEHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        monkeypatch.setattr(gemini_dr, "BASE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+        try:
+            report, final_data = gemini_dr._stream_response("test-key", "abc")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert report == "Hello world"
+        assert _ResumingSSEHandler.last_event_ids == [None, "1"]
+        # Citations are available from the completion payload without a GET
+        assert gemini_dr._extract_sources(final_data) == [{"url": "https://a.example", "title": "A"}]
@@ -15,8 +15,10 @@ Strategy:
 """
 
 import json
+import random
 import sys
 import unittest
+from functools import lru_cache
 from pathlib import Path
 from typing import Set
 
@@ -35,6 +37,11 @@ from lib.matrix import (
     _jaccard_similarity,
     _extract_body_keywords,
     _jaccard_similarity_sets,
+    _best_match,
+    _build_word_index,
+    _build_word_masks,
+    _extract_urls,
+    reset_caches,
     STOP_WORDS,
 )
 from lib.render import ProviderResult
@@ -46,11 +53,28 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 # Helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def _load_fixture(name: str) -> dict:
+    """Parsed fixture JSON, read once per process. Callers must not mutate it."""
     with open(FIXTURES_DIR / name) as f:
         return json.load(f)
 
 
+@lru_cache(maxsize=None)
+def _load_provider_result(fixture_name: str) -> ProviderResult:
+    """ProviderResult for a sample fixture, built once per process and shared read-only."""
+    data = _load_fixture(fixture_name)
+    provider = fixture_name.replace("_sample.json", "")
+    return ProviderResult(
+        provider=provider,
+        success=data.get("success", True),
+        report=data.get("report", ""),
+        citations=data.get("citations", []),
+        model=data.get("model", f"mock-{provider}"),
+        elapsed_seconds=data.get("elapsed_seconds", 0.0),
+    )
+
+
 def _provider_result(provider: str, report: str, citations=None) -> ProviderResult:
     return ProviderResult(
         provider=provider,
@@ -62,6 +86,19 @@ def _provider_result(provider: str, report: str, citations=None) -> ProviderResu
     )
 
 
+def _make_topic(heading: str, coverage: str = "detailed") -> Topic:
+    # Topic is mutable (body_keywords is a set), so build a fresh one per call
+    # rather than caching instances; _normalize_heading is memoized in lib.matrix.
+    return Topic(
+        heading=_normalize_heading(heading),
+        raw_heading=heading,
+        level=2,
+        word_count=150 if coverage == "detailed" else 20,
+        coverage=coverage,
+        citations_in_section=0,
+    )
+
+
 # ---------------------------------------------------------------------------
 # _normalize_heading
 # ---------------------------------------------------------------------------
@@ -97,6 +134,14 @@ class TestNormalizeHeading(unittest.TestCase):
         result = _normalize_heading("  Section One  ")
         self.assertEqual(result, "section one")
 
+    def test_memoized_and_resettable(self):
+        reset_caches()
+        _normalize_heading("1. Key Findings")
+        _normalize_heading("1. Key Findings")
+        self.assertEqual(_normalize_heading.cache_info().hits, 1)
+        reset_caches()
+        self.assertEqual(_normalize_heading.cache_info().currsize, 0)
+
 
 # ---------------------------------------------------------------------------
 # _jaccard_similarity
@@ -216,6 +261,18 @@ See https://example.com/paper1 and https://example.org/doc2 for details.
         refs = next(t for t in topics if t.heading == "references")
         self.assertEqual(refs.citations_in_section, 2)
 
+    def test_citations_bucketed_per_section(self):
+        """URLs count toward their own section only; heading-line URLs are ignored."""
+        report = (
+            "Preamble https://pre.example\n"
+            "## Sources https://in-heading.example\n"
+            "https://a.example https://b.example\n"
+            "## Next\n"
+            "https://c.example\n"
+        )
+        topics = extract_topics(report)
+        self.assertEqual([t.citations_in_section for t in topics], [2, 1])
+
     def test_h4_headings_extracted(self):
         report = """#### Deep Nested Section
 
@@ -241,6 +298,15 @@ Content here.
         topics = extract_topics(report)
         self.assertEqual(topics[0].heading, "background")
 
+    def test_topic_words_precomputed(self):
+        """Topic.words is the heading word set, matching the string form."""
+        topics = extract_topics("## APT Group Links\n\nbody\n\n## APT Group Connections\n\nbody\n")
+        self.assertEqual(topics[0].words, frozenset({"apt", "group", "links"}))
+        self.assertAlmostEqual(
+            _jaccard_similarity_sets(topics[0].words, topics[1].words),
+            _jaccard_similarity(topics[0].heading, topics[1].heading),
+        )
+
 
 # ---------------------------------------------------------------------------
 # match_topics
@@ -249,21 +315,10 @@ Content here.
 class TestMatchTopics(unittest.TestCase):
     """Cross-provider topic matching."""
 
-    def _make_topic(self, heading: str, coverage: str = "detailed") -> Topic:
-        normalized = _normalize_heading(heading)
-        return Topic(
-            heading=normalized,
-            raw_heading=heading,
-            level=2,
-            word_count=150 if coverage == "detailed" else 20,
-            coverage=coverage,
-            citations_in_section=0,
-        )
-
     def test_exact_match_two_providers(self):
         topics = {
-            "openai": [self._make_topic("Company Overview")],
-            "perplexity": [self._make_topic("Company Overview")],
+            "openai": [_make_topic("Company Overview")],
+            "perplexity": [_make_topic("Company Overview")],
         }
         matched = match_topics(topics)
         self.assertEqual(len(matched), 1)
@@ -273,9 +328,9 @@ class TestMatchTopics(unittest.TestCase):
 
     def test_exact_match_three_providers(self):
         topics = {
-            "openai": [self._make_topic("Key Findings")],
-            "perplexity": [self._make_topic("Key Findings")],
-            "gemini": [self._make_topic("Key Findings")],
+            "openai": [_make_topic("Key Findings")],
+            "perplexity": [_make_topic("Key Findings")],
+            "gemini": [_make_topic("Key Findings")],
         }
         matched = match_topics(topics)
         self.assertEqual(len(matched), 1)
@@ -299,8 +354,8 @@ class TestMatchTopics(unittest.TestCase):
         # Use strictly above: 4-word intersection / 5-word union is NOT strictly above.
         # Use 4/5 with the threshold check being >= : 3/5 = 0.60 meets FUZZY_MATCH_THRESHOLD >= 0.60
         topics = {
-            "openai": [self._make_topic("APT Group Connections Overview")],
-            "perplexity": [self._make_topic("APT Group Connections Analysis")],
+            "openai": [_make_topic("APT Group Connections Overview")],
+            "perplexity": [_make_topic("APT Group Connections Analysis")],
         }
         matched = match_topics(topics)
         # intersection={apt,group,connections} / union={apt,group,connections,overview,analysis} = 3/5 = 0.60
@@ -309,8 +364,8 @@ class TestMatchTopics(unittest.TestCase):
 
     def test_unmatched_topic_unique_to_one_provider(self):
         topics = {
-            "openai": [self._make_topic("Company Overview")],
-            "perplexity": [self._make_topic("Totally Different Topic")],
+            "openai": [_make_topic("Company Overview")],
+            "perplexity": [_make_topic("Totally Different Topic")],
         }
         matched = match_topics(topics)
         self.assertEqual(len(matched), 2)
@@ -320,8 +375,8 @@ class TestMatchTopics(unittest.TestCase):
     def test_absent_provider_in_coverage(self):
         """Provider not covering a topic shows 'absent'."""
         topics = {
-            "openai": [self._make_topic("Company Overview"), self._make_topic("Key Findings")],
-            "perplexity": [self._make_topic("Company Overview")],
+            "openai": [_make_topic("Company Overview"), _make_topic("Key Findings")],
+            "perplexity": [_make_topic("Company Overview")],
         }
         matched = match_topics(topics)
         # Find the Key Findings topic
@@ -331,8 +386,8 @@ class TestMatchTopics(unittest.TestCase):
     def test_single_provider_all_unique(self):
         topics = {
             "openai": [
-                self._make_topic("Company Overview"),
-                self._make_topic("Key Findings"),
+                _make_topic("Company Overview"),
+                _make_topic("Key Findings"),
             ],
         }
         matched = match_topics(topics)
@@ -350,14 +405,55 @@ class TestMatchTopics(unittest.TestCase):
     def test_coverage_level_preserved(self):
         """Detailed vs mentioned coverage is preserved in MatchedTopic."""
         topics = {
-            "openai": [self._make_topic("Background", coverage="detailed")],
-            "perplexity": [self._make_topic("Background", coverage="mentioned")],
+            "openai": [_make_topic("Background", coverage="detailed")],
+            "perplexity": [_make_topic("Background", coverage="mentioned")],
         }
         matched = match_topics(topics)
         self.assertEqual(len(matched), 1)
         self.assertEqual(matched[0].coverage["openai"], "detailed")
         self.assertEqual(matched[0].coverage["perplexity"], "mentioned")
 
+    def test_length_filter_keeps_threshold_pairs(self):
+        """3-of-5 word overlap (exactly 0.60) still matches under the length filter."""
+        topics = {
+            "openai": [Topic("a b c", "a b c", 2, 150, "detailed", 0)],
+            "gemini": [Topic("a b c d e", "a b c d e", 2, 150, "detailed", 0)],
+        }
+        matched = match_topics(topics)
+        self.assertEqual(len(matched), 1)
+        self.assertEqual(matched[0].match_method, "heading-fuzzy")
+
+
+# ---------------------------------------------------------------------------
+# _best_match
+# ---------------------------------------------------------------------------
+
+class TestBestMatch(unittest.TestCase):
+    """Fuzzy candidate lookup: word-index and bitmask paths agree with a linear scan."""
+
+    def test_word_index_matches_full_scan(self):
+        """Indexed and bitmask lookups return exactly what a linear set scan returns."""
+        rng = random.Random(7)
+        vocab = ["apt", "group", "links", "company", "overview", "supply", "chain", "risk"]
+
+        def topic(words):
+            heading = " ".join(words)
+            return Topic(heading, heading, 2, 150, "detailed", 0)
+
+        candidates = [topic(rng.sample(vocab, rng.randint(1, 4))) for _ in range(40)]
+        needles = [topic(rng.sample(vocab, rng.randint(1, 4))) for _ in range(200)]
+        index = _build_word_index(candidates)
+        masks = _build_word_masks({"needles": needles, "candidates": candidates})
+        for i, needle in enumerate(needles):
+            used = set(rng.sample(range(40), rng.randint(0, 20)))
+            expected = _best_match(needle, candidates, used)
+            self.assertEqual(_best_match(needle, candidates, used, index), expected)
+            self.assertEqual(
+                _best_match(needle, candidates, used, index,
+                            masks["needles"][i], masks["candidates"]),
+                expected,
+            )
+
 
 # ---------------------------------------------------------------------------
 # Agreement classification
@@ -366,30 +462,19 @@ class TestMatchTopics(unittest.TestCase):
 class TestAgreementClassification(unittest.TestCase):
     """Verify consensus/majority/unique agreement levels."""
 
-    def _make_topic(self, heading: str, coverage: str = "detailed") -> Topic:
-        normalized = _normalize_heading(heading)
-        return Topic(
-            heading=normalized,
-            raw_heading=heading,
-            level=2,
-            word_count=150 if coverage == "detailed" else 20,
-            coverage=coverage,
-            citations_in_section=0,
-        )
-
     def test_consensus_all_three_providers(self):
         topics = {
-            "openai": [self._make_topic("Shared Topic")],
-            "perplexity": [self._make_topic("Shared Topic")],
-            "gemini": [self._make_topic("Shared Topic")],
+            "openai": [_make_topic("Shared Topic")],
+            "perplexity": [_make_topic("Shared Topic")],
+            "gemini": [_make_topic("Shared Topic")],
         }
         matched = match_topics(topics)
         self.assertEqual(matched[0].agreement_level, "consensus")
 
     def test_majority_two_of_three_providers(self):
         topics = {
-            "openai": [self._make_topic("Shared Topic")],
-            "perplexity": [self._make_topic("Shared Topic")],
+            "openai": [_make_topic("Shared Topic")],
+            "perplexity": [_make_topic("Shared Topic")],
             "gemini": [],
         }
         matched = match_topics(topics)
@@ -397,7 +482,7 @@ class TestAgreementClassification(unittest.TestCase):
 
     def test_unique_one_of_three_providers(self):
         topics = {
-            "openai": [self._make_topic("Unique Topic")],
+            "openai": [_make_topic("Unique Topic")],
             "perplexity": [],
             "gemini": [],
         }
@@ -408,7 +493,7 @@ class TestAgreementClassification(unittest.TestCase):
         topics = {
             "openai": [],
             "perplexity": [],
-            "gemini": [self._make_topic("Gemini Only")],
+            "gemini": [_make_topic("Gemini Only")],
         }
         matched = match_topics(topics)
         self.assertEqual(matched[0].agreement_level, "unique-gemini")
@@ -488,22 +573,24 @@ Multiple security firms contributed research to this topic and
 their findings are synthesized here.
 """
 
-    def setUp(self):
-        self.results = [
-            _provider_result("openai", self.OPENAI_REPORT, citations=[
+    @classmethod
+    def setUpClass(cls):
+        # Read-only across tests: build the shared matrix once per class
+        cls.results = [
+            _provider_result("openai", cls.OPENAI_REPORT, citations=[
                 {"url": "https://example.com/shared"},
                 {"url": "https://openai-only.com/paper"},
             ]),
-            _provider_result("perplexity", self.PERPLEXITY_REPORT, citations=[
+            _provider_result("perplexity", cls.PERPLEXITY_REPORT, citations=[
                 {"url": "https://example.com/shared"},
                 {"url": "https://perplexity-only.com/doc"},
             ]),
-            _provider_result("gemini", self.GEMINI_REPORT, citations=[
+            _provider_result("gemini", cls.GEMINI_REPORT, citations=[
                 {"url": "https://example.com/shared"},
                 {"url": "https://gemini-only.com/report"},
             ]),
         ]
-        self.matrix = build_matrix(self.results)
+        cls.matrix = build_matrix(cls.results)
 
     def test_returns_comparison_matrix(self):
         self.assertIsInstance(self.matrix, ComparisonMatrix)
@@ -592,6 +679,26 @@ their findings are synthesized here.
             self.assertGreaterEqual(len(providers), 2)
 
 
+# ---------------------------------------------------------------------------
+# _extract_urls
+# ---------------------------------------------------------------------------
+
+class TestExtractUrls(unittest.TestCase):
+    """Citation URL normalization used for citation overlap."""
+
+    def test_extract_urls_homogeneous_and_mixed(self):
+        """Dict, string and mixed citation lists normalize to the same URL set."""
+        dicts = [{"url": " https://a.com "}, {"url": ""}, {"title": "no url"}, {"url": "https://b.com"}]
+        strings = [" https://a.com", "   ", "https://b.com"]
+        mixed = ["https://a.com", {"url": "https://b.com"}, None]
+        expected = {"https://a.com", "https://b.com"}
+        self.assertEqual(_extract_urls(dicts), expected)
+        self.assertEqual(_extract_urls(strings), expected)
+        self.assertEqual(_extract_urls(mixed), expected)
+        self.assertEqual(_extract_urls([{"url": "https://b.com"}, "https://a.com"]), expected)
+        self.assertEqual(_extract_urls([]), set())
+
+
 # ---------------------------------------------------------------------------
 # Fixture integration test
 # ---------------------------------------------------------------------------
@@ -599,49 +706,29 @@ their findings are synthesized here.
 class TestFixtureIntegration(unittest.TestCase):
     """Run build_matrix against the real sample fixture files."""
 
-    def _load_provider_result(self, fixture_name: str) -> ProviderResult:
-        data = _load_fixture(fixture_name)
-        provider = fixture_name.replace("_sample.json", "")
-        return ProviderResult(
-            provider=provider,
-            success=data.get("success", True),
-            report=data.get("report", ""),
-            citations=data.get("citations", []),
-            model=data.get("model", f"mock-{provider}"),
-            elapsed_seconds=data.get("elapsed_seconds", 0.0),
-        )
+    @classmethod
+    def setUpClass(cls):
+        # None of the tests mutate the results or the matrix, so build once
+        cls.results = [
+            _load_provider_result("openai_sample.json"),
+            _load_provider_result("perplexity_sample.json"),
+            _load_provider_result("gemini_sample.json"),
+        ]
+        cls.matrix = build_matrix(cls.results)
 
     def test_build_matrix_with_fixtures(self):
-        results = [
-            self._load_provider_result("openai_sample.json"),
-            self._load_provider_result("perplexity_sample.json"),
-            self._load_provider_result("gemini_sample.json"),
-        ]
-        matrix = build_matrix(results)
-        self.assertIsInstance(matrix, ComparisonMatrix)
-        self.assertEqual(set(matrix.providers), {"openai", "perplexity", "gemini"})
-        self.assertGreater(len(matrix.topics), 0)
+        self.assertIsInstance(self.matrix, ComparisonMatrix)
+        self.assertEqual(set(self.matrix.providers), {"openai", "perplexity", "gemini"})
+        self.assertGreater(len(self.matrix.topics), 0)
 
     def test_fixture_topics_have_valid_coverage(self):
-        results = [
-            self._load_provider_result("openai_sample.json"),
-            self._load_provider_result("perplexity_sample.json"),
-            self._load_provider_result("gemini_sample.json"),
-        ]
-        matrix = build_matrix(results)
         valid_levels = {"detailed", "mentioned", "absent"}
-        for t in matrix.topics:
+        for t in self.matrix.topics:
             for provider, level in t.coverage.items():
                 self.assertIn(level, valid_levels, f"Invalid coverage level '{level}' for provider '{provider}' in topic '{t.canonical_name}'")
 
     def test_fixture_stats_sanity(self):
-        results = [
-            self._load_provider_result("openai_sample.json"),
-            self._load_provider_result("perplexity_sample.json"),
-            self._load_provider_result("gemini_sample.json"),
-        ]
-        matrix = build_matrix(results)
-        stats = matrix.stats
+        stats = self.matrix.stats
         self.assertGreater(stats["total_topics"], 0)
         self.assertGreaterEqual(stats["consensus"], 0)
         self.assertGreaterEqual(stats["majority"], 0)
@@ -649,14 +736,8 @@ class TestFixtureIntegration(unittest.TestCase):
 
     def test_fixture_serializes_to_json(self):
         import json
-        results = [
-            self._load_provider_result("openai_sample.json"),
-            self._load_provider_result("perplexity_sample.json"),
-            self._load_provider_result("gemini_sample.json"),
-        ]
-        matrix = build_matrix(results)
         # Should not raise
-        serialized = json.dumps(matrix.to_dict())
+        serialized = json.dumps(self.matrix.to_dict())
         self.assertGreater(len(serialized), 10)
 
 
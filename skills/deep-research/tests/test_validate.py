@@ -9,14 +9,21 @@ New tests cover B1 (non-dict citation), B2 (HEAD 405 fallback), B3 (depth 3 clai
 extraction), F1 (extract_claim_context), and F2 (resolve_redirects).
 """
 
+import gzip
+import http.server
+import os
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 SCRIPT_DIR = Path(__file__).parent.parent / "scripts"
 sys.path.insert(0, str(SCRIPT_DIR))
 
+from lib import validate as lib_validate
 from lib.render import ProviderResult
 from lib.validate import (
     validate_citations,
@@ -262,8 +269,8 @@ class TestValidateCitations(unittest.TestCase):
     def test_validate_url_liveness_get_returns_valid_for_example_com(self):
         """_validate_url_liveness_get returns valid/unreachable for example.com (B2)."""
         result = _validate_url_liveness_get("https://example.com")
-        self.assertIn("status", result)
-        self.assertIn(result["status"], ["valid", "unreachable"])
+        self.assertIsInstance(result, lib_validate.ValidationResult)
+        self.assertIn(result.status, ["valid", "unreachable"])
 
     # --- F1: _extract_claim_context ---
 
@@ -453,6 +460,365 @@ class TestValidateCitations(unittest.TestCase):
         self.assertNotIn("resolved_url", citation)
 
 
+class _SlowHeadHandler(http.server.BaseHTTPRequestHandler):
+    """Answers HEAD after a short delay, tracking peak concurrent requests."""
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def log_message(self, fmt, *args):  # suppress default stderr noise
+        pass
+
+    def do_HEAD(self):
+        cls = self.__class__
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        time.sleep(0.1)
+        with cls.lock:
+            cls.in_flight -= 1
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class TestConcurrentValidation(unittest.TestCase):
+    """validate_citations() runs checks concurrently, bounded per host."""
+
+    def setUp(self):
+        lib_validate.cache_clear()
+        _SlowHeadHandler.in_flight = 0
+        _SlowHeadHandler.peak = 0
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SlowHeadHandler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _results(self, n):
+        citations = [{"url": f"{self.base_url}/page/{i}"} for i in range(n)]
+        return [ProviderResult(provider="openai", success=True, citations=citations)]
+
+    def test_per_host_limit_respected(self):
+        with mock.patch.object(lib_validate, "HOST_MIN_INTERVAL", 0):
+            results = validate_citations(self._results(12), depth=1)
+        statuses = [c["validation"]["status"] for c in results[0].citations]
+        self.assertEqual(statuses, ["valid"] * 12)
+        self.assertGreater(_SlowHeadHandler.peak, 1)
+        self.assertLessEqual(_SlowHeadHandler.peak, lib_validate.PER_HOST_CONCURRENCY)
+
+    def test_single_worker_is_sequential(self):
+        with mock.patch.object(lib_validate, "HOST_MIN_INTERVAL", 0):
+            results = validate_citations(self._results(4), depth=1, max_workers=1)
+        self.assertEqual(_SlowHeadHandler.peak, 1)
+        self.assertTrue(all(c["validation"]["status"] == "valid" for c in results[0].citations))
+
+    def test_liveness_default_workers(self):
+        """Depth 1 defaults to LIVENESS_WORKERS, deeper checks to VALIDATE_WORKERS."""
+        for depth, expected in ((1, lib_validate.LIVENESS_WORKERS), (2, lib_validate.VALIDATE_WORKERS)):
+            with mock.patch.object(lib_validate, "ThreadPoolExecutor", side_effect=RuntimeError) as executor:
+                with self.assertRaises(RuntimeError):
+                    validate_citations(self._results(40), depth=depth)
+            self.assertEqual(executor.call_args.kwargs["max_workers"], expected)
+
+
+class _KeepAlivePageHandler(http.server.BaseHTTPRequestHandler):
+    """HTTP/1.1 handler serving a small page, with /old redirecting to /page."""
+
+    protocol_version = "HTTP/1.1"
+    connections: set = set()
+    requests = 0
+    not_modified = 0
+    last_range = None
+
+    def log_message(self, fmt, *args):  # suppress default stderr noise
+        pass
+
+    def _reply(self, with_body: bool):
+        self.__class__.connections.add(self.client_address)
+        self.__class__.requests += 1
+        if self.path.startswith("/old"):
+            self.send_response(302)
+            self.send_header("Location", "/page")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.__class__.last_range = self.headers.get("Range")
+        if self.path.startswith("/etag") and self.headers.get("If-None-Match") == '"v1"':
+            self.__class__.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        body = b"<html><title>Quantum Widgets Explained</title></html>"
+        content_type = "text/html"
+        if self.path.startswith("/doc.pdf"):
+            body, content_type = b"%PDF-1.7 Quantum Widgets Explained" + b"0" * 100000, "application/pdf"
+        if self.path.startswith("/big"):
+            # Title well past the first read chunk, then lots of trailing filler.
+            body = b"x" * 40000 + body + b"y" * 400000
+        encoded = "gzip" in self.headers.get("Accept-Encoding", "") and self.path.startswith("/gz")
+        if encoded:
+            body = gzip.compress(b"x" * 40000 + body + b"y" * 400000)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        if self.path.startswith("/etag"):
+            self.send_header("ETag", '"v1"')
+        if encoded:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self._reply(with_body=False)
+
+    def do_GET(self):
+        self._reply(with_body=True)
+
+
+class _CountingScan(lib_validate._PageScan):
+    """_PageScan that also totals the (decoded) body bytes it is fed."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fed = 0
+
+    def feed(self, chunk: bytes) -> bool:
+        self.fed += len(chunk)
+        return super().feed(chunk)
+
+
+class TestPooledValidation(unittest.TestCase):
+    """Validation reuses keep-alive connections and follows redirects."""
+
+    def setUp(self):
+        lib_validate.cache_clear()
+        _KeepAlivePageHandler.connections = set()
+        _KeepAlivePageHandler.requests = 0
+        _KeepAlivePageHandler.not_modified = 0
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _KeepAlivePageHandler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_sequential_citations_share_connection(self):
+        citations = [{"url": f"{self.base_url}/page?{i}"} for i in range(4)]
+        results = [ProviderResult(provider="openai", success=True, citations=citations)]
+        with mock.patch.object(lib_validate, "HOST_MIN_INTERVAL", 0):
+            validate_citations(results, depth=1, max_workers=1)
+        self.assertTrue(all(c["validation"]["status"] == "valid" for c in citations))
+        self.assertEqual(len(_KeepAlivePageHandler.connections), 1)
+
+    def test_redirect_followed_for_relevance(self):
+        citations = [{"url": f"{self.base_url}/old", "title": "Quantum Widgets Explained"}]
+        results = [ProviderResult(provider="openai", success=True, citations=citations)]
+        with mock.patch.object(lib_validate, "HOST_MIN_INTERVAL", 0):
+            validate_citations(results, depth=2)
+        self.assertEqual(citations[0]["validation"]["status"], "valid")
+        self.assertEqual(citations[0]["validation"]["details"], "Citation title found in page")
+
+    def test_large_page_scanned_in_chunks(self):
+        """A title past the first chunk is found; the body cap is respected."""
+        result = lib_validate._validate_url_relevance(f"{self.base_url}/big", "Quantum Widgets Explained")
+        self.assertEqual(result.status, "valid")
+        self.assertEqual(result.details, "Citation title found in page")
+        scan = _CountingScan(words=["absentword"])  # never satisfied: reads up to the cap
+        self.assertEqual(lib_validate._scan_page(f"{self.base_url}/big", scan), 200)
+        self.assertEqual(scan.fed, lib_validate.HTML_MAX_BYTES)
+
+    def test_gzip_page_inflated_and_capped(self):
+        """Compressed pages are inflated while streaming; the cap applies to decoded bytes."""
+        result = lib_validate._validate_url_relevance(f"{self.base_url}/gz", "Quantum Widgets Explained")
+        self.assertEqual(result.details, "Citation title found in page")
+        scan = _CountingScan(words=["absentword"])
+        self.assertEqual(lib_validate._scan_page(f"{self.base_url}/gz", scan), 200)
+        self.assertEqual(scan.fed, lib_validate.HTML_MAX_BYTES)
+
+    def test_http_citation_validated_through_proxy(self):
+        """With http_proxy set, a plain-http citation is forwarded, not CONNECT-tunnelled."""
+        citations = [{"url": "http://citations.example/page"}]
+        results = [ProviderResult(provider="openai", success=True, citations=citations)]
+        env = {"http_proxy": self.base_url, "no_proxy": ""}
+        with mock.patch.dict(os.environ, env), mock.patch.object(lib_validate, "HOST_MIN_INTERVAL", 0):
+            validate_citations(results, depth=1)
+        # The stand-in proxy answers absolute-URI requests itself and has no CONNECT
+        self.assertEqual(citations[0]["validation"]["status"], "valid")
+        self.assertEqual(_KeepAlivePageHandler.requests, 1)
+
+    def test_expired_entry_revalidated_with_etag(self):
+        """An expired cache entry is re-checked with If-None-Match; a 304 reuses it."""
+        results = [ProviderResult(provider="openai", success=True,
+                                  citations=[{"url": f"{self.base_url}/etag", "title": "Quantum Widgets Explained"}])]
+        with mock.patch.object(lib_validate, "HOST_MIN_INTERVAL", 0), \
+                mock.patch.object(lib_validate._CACHE, "ttl", 0):
+            validate_citations(results, depth=2)
+            first = results[0].citations[0]["validation"]
+            validate_citations(results, depth=2)
+        self.assertEqual(_KeepAlivePageHandler.requests, 2)
+        self.assertEqual(_KeepAlivePageHandler.not_modified, 1)
+        self.assertEqual(results[0].citations[0]["validation"], first)
+        self.assertEqual(first["details"], "Citation title found in page")
+
+    def test_non_html_skipped_without_reading(self):
+        """PDFs are reported as skipped; scans request only the byte-capped prefix."""
+        result = lib_validate._validate_url_relevance(f"{self.base_url}/doc.pdf", "Quantum Widgets Explained")
+        self.assertEqual(result, lib_validate.ValidationResult("skipped", "Non-HTML content (application/pdf)"))
+        self.assertEqual(_KeepAlivePageHandler.last_range, f"bytes=0-{lib_validate.HTML_MAX_BYTES - 1}")
+
+    def test_duplicate_url_fetched_once(self):
+        """The same URL cited by several providers is fetched once per batch."""
+        url = f"{self.base_url}/page"
+        results = [
+            ProviderResult(provider=p, success=True, citations=[{"url": url}, {"url": f"{url}?{p}"}])
+            for p in ("openai", "perplexity", "gemini")
+        ]
+        with mock.patch.object(lib_validate, "HOST_MIN_INTERVAL", 0):
+            validate_citations(results, depth=1)
+        self.assertEqual(_KeepAlivePageHandler.requests, 4)
+        shared = [r.citations[0]["validation"] for r in results]
+        self.assertTrue(all(v["status"] == "valid" for v in shared))
+        self.assertIsNot(shared[0], shared[1])
+
+    def test_cached_grounding_redirect_makes_no_request(self):
+        """A repeat grounding-redirect citation skips the resolving HEAD as well."""
+        url = f"{self.base_url}/old/{lib_validate._GROUNDING_REDIRECT}/abc"  # 302 -> /page
+
+        def validate() -> dict:
+            citation = {"url": url}
+            with mock.patch.object(lib_validate, "HOST_MIN_INTERVAL", 0):
+                validate_citations([ProviderResult(provider="gemini", success=True, citations=[citation])], depth=1)
+            return citation
+
+        validate()
+        first_run_requests = _KeepAlivePageHandler.requests
+        citation = validate()
+        self.assertGreater(first_run_requests, 0)
+        self.assertEqual(_KeepAlivePageHandler.requests, first_run_requests)
+        self.assertEqual(citation["resolved_url"], f"{self.base_url}/page")
+        self.assertEqual(citation["validation"]["status"], "valid")
+
+    def test_repeat_batch_served_from_cache(self):
+        """A URL validated in an earlier call is answered from the cache."""
+        url = f"{self.base_url}/page"
+        for _ in range(2):
+            results = [ProviderResult(provider="openai", success=True, citations=[{"url": url}])]
+            with mock.patch.object(lib_validate, "HOST_MIN_INTERVAL", 0):
+                validate_citations(results, depth=1)
+        self.assertEqual(_KeepAlivePageHandler.requests, 1)
+        self.assertEqual(results[0].citations[0]["validation"]["status"], "valid")
+        info = lib_validate.cache_info()
+        self.assertEqual((info.hits, info.currsize), (1, 1))
+
+
+class TestHostLimiter(unittest.TestCase):
+    """_HostLimiter spaces request starts per host, not across hosts."""
+
+    def test_same_host_spaced_other_host_immediate(self):
+        limiter = lib_validate._HostLimiter(limit=4, min_interval=0.1)
+        starts = []
+        t0 = time.monotonic()
+        for url in ("https://a.example/1", "https://a.example/2", "https://b.example/1"):
+            with limiter.hold(url):
+                starts.append(time.monotonic() - t0)
+        self.assertGreaterEqual(starts[1] - starts[0], 0.09)
+        self.assertLess(starts[2] - starts[1], 0.05)
+
+
+class TestValidationCache(unittest.TestCase):
+    """ValidationCache evicts by LRU order and by TTL."""
+
+    def test_lru_eviction(self):
+        cache = lib_validate.ValidationCache(maxsize=2, ttl=60)
+        cache.set("a", lib_validate.ValidationResult("valid"))
+        cache.set("b", lib_validate.ValidationResult("valid"))
+        cache.get("a")
+        cache.set("c", lib_validate.ValidationResult("valid"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertEqual(cache.info().currsize, 2)
+
+    def test_expired_entry_is_evicted(self):
+        cache = lib_validate.ValidationCache(maxsize=2, ttl=0)
+        cache.set("a", lib_validate.ValidationResult("valid"))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.info().currsize, 0)
+
+
+class TestPageScan(unittest.TestCase):
+    """_PageScan finds needles across chunk boundaries (DEC-VALIDATE-STREAM-001)."""
+
+    def test_phrase_straddling_chunks(self):
+        scan = lib_validate._PageScan("quantum widgets", ["quantum", "widgets"])
+        self.assertFalse(scan.feed(b"<p>All about QUANT"))
+        self.assertTrue(scan.feed(b"UM Widgets</p>"))
+        self.assertTrue(scan.found_phrase)
+
+    def test_multibyte_character_split(self):
+        data = "Résumé tips".encode("utf-8")
+        split = data.index(b"\xc3") + 1  # cut inside the two-byte "é"
+        scan = lib_validate._PageScan(words=["résumé"])
+        scan.feed(data[:split])
+        self.assertTrue(scan.feed(data[split:]))
+
+    def test_ascii_needles_skip_decoding_after_head(self):
+        """ASCII needles match raw bytes; non-ASCII page text doesn't break them."""
+        scan = lib_validate._PageScan(words=["widget", "pricing"])
+        with mock.patch.object(scan, "_decode", side_effect=AssertionError("decoded")):
+            self.assertFalse(scan.feed("Café WIDGET PRI".encode("utf-8")))
+            self.assertTrue(scan.feed(b"CING table"))
+        self.assertEqual(scan.found_words, {"widget", "pricing"})
+
+    def test_words_only_done_when_all_found(self):
+        scan = lib_validate._PageScan(words=["alpha", "beta"])
+        self.assertFalse(scan.feed(b"alpha"))
+        self.assertTrue(scan.feed(b" and beta"))
+        self.assertEqual(scan.found_words, {"alpha", "beta"})
+
+    def test_min_hits_stops_once_threshold_guaranteed(self):
+        """Repeated words count once per occurrence; done at min_hits."""
+        words = ["alpha", "alpha", "beta", "gamma", "delta"]
+        need = lib_validate._min_hits(len(words), lib_validate.CLAIM_THRESHOLD)
+        self.assertEqual(need, 3)
+        scan = lib_validate._PageScan(words=words, min_hits=need)
+        self.assertFalse(scan.feed(b"beta"))
+        self.assertTrue(scan.feed(b" alpha"))
+        self.assertEqual(scan.hits, 3)
+        self.assertEqual(scan.found_words, {"alpha", "beta"})
+
+    def test_title_entities_decoded_in_head(self):
+        """A phrase matching the entity-decoded <title> counts as found."""
+        scan = lib_validate._PageScan("tom's guide to widgets")
+        page = b"<html><head><title>Tom&#39;s Guide\n  to Widgets</title></head><body>x</body>"
+        self.assertTrue(scan.feed(page))
+
+    def test_meta_description_matches(self):
+        scan = lib_validate._PageScan("widget pricing explained")
+        scan.feed(b'<head><meta name="description" content="Widget pricing &amp; more: ')
+        self.assertFalse(scan.done)
+        scan = lib_validate._PageScan("widget pricing explained")
+        self.assertTrue(scan.feed(b'<head><meta property="og:title" content="Widget Pricing Explained"></head>'))
+
+    def test_tokenize_keywords_is_cached(self):
+        lib_validate._tokenize_keywords.cache_clear()
+        first = lib_validate._tokenize_keywords("The Quantum Widget Handbook")
+        self.assertEqual(first, ("quantum", "widget", "handbook"))
+        self.assertIs(lib_validate._tokenize_keywords("The Quantum Widget Handbook"), first)
+        self.assertEqual(lib_validate._tokenize_keywords.cache_info().hits, 1)
+
+    def test_no_needles_is_done(self):
+        self.assertTrue(lib_validate._PageScan().done)
+
+
 class TestValidationFunctionSignatures(unittest.TestCase):
     """Test that validation helper functions exist with correct signatures."""
 
@@ -20,6 +20,7 @@ Tests verify:
 - Timeout buffer of 60s in as_completed call
 """
 
+import functools
 import json
 import os
 import subprocess
@@ -32,12 +33,64 @@ from pathlib import Path
 SCRIPT_DIR = Path(__file__).parent.parent / "scripts"
 sys.path.insert(0, str(SCRIPT_DIR))
 
-from lib.render import ProviderResult, render_json
+from lib.render import ProviderResult, render_json, write_json
+
+
+@functools.lru_cache(maxsize=None)
+def _read_source(relpath: str) -> str:
+    """Source of a file under scripts/, read once per test run."""
+    return (SCRIPT_DIR / relpath).read_text()
 
 
 class TestWarnings(unittest.TestCase):
     """Test the deep-research warning system."""
 
+    def test_provider_result_to_dict_covers_all_fields(self):
+        """to_dict() is hand-built; it must stay in sync with the dataclass."""
+        from dataclasses import asdict, fields
+
+        result = ProviderResult(
+            provider="openai", success=True, report="r",
+            citations=[{"url": "https://example.com"}], model="m",
+            elapsed_seconds=1.5,
+        )
+        self.assertEqual(list(result.to_dict()), [f.name for f in fields(result)])
+        self.assertEqual(result.to_dict(), asdict(result))
+
+    def test_write_json_matches_render_json(self):
+        """write_json() streams the same document render_json() returns."""
+        import io
+
+        results = [
+            ProviderResult(provider="openai", success=True, report="Café report",
+                           citations=["https://example.com"], model="m"),
+            ProviderResult(provider="gemini", success=False, error="boom"),
+        ]
+        matrix = {"topics": [], "citation_overlap": []}
+        buf = io.StringIO()
+        write_json(buf, results, "topic", comparison_matrix=matrix)
+        self.assertEqual(buf.getvalue(),
+                         render_json(results, "topic", comparison_matrix=matrix))
+
+    def test_render_json_citation_validation_summary(self):
+        """Validation counts are aggregated across providers in one pass."""
+        def cite(status):
+            return {"url": "https://example.com", "validation": {"depth": 1, "status": status}}
+
+        results = [
+            ProviderResult(provider="openai", success=True,
+                           citations=[cite("valid"), cite("invalid"), "https://plain.example"]),
+            ProviderResult(provider="gemini", success=True,
+                           citations=[cite("valid"), cite("unreachable"), cite("skipped")]),
+        ]
+        data = json.loads(render_json(results, "topic"))
+        self.assertEqual(data["citation_validation"], {
+            "depth": 1, "total": 5, "valid": 2, "invalid": 1,
+            "unreachable": 1, "skipped": 1,
+        })
+        self.assertNotIn("citation_validation",
+                         json.loads(render_json([ProviderResult("openai", True)], "topic")))
+
     def test_render_json_warnings_empty_on_success(self):
         """Verify warnings list is empty when all providers succeed."""
         results = [
@@ -176,7 +229,7 @@ from pathlib import Path
 SCRIPT_DIR = Path("{SCRIPT_DIR}").resolve()
 sys.path.insert(0, str(SCRIPT_DIR))
 
-from lib.render import ProviderResult, render_json
+from lib.render import ProviderResult, write_json
 
 # Simulate results with one failure
 results = [
@@ -201,7 +254,7 @@ results = [
 out = Path("{tmpdir}")
 out.mkdir(parents=True, exist_ok=True)
 with open(out / "raw_results.json", "w") as f:
-    f.write(render_json(results, "test topic"))
+    write_json(f, results, "test topic")
 
 print(str(out / "raw_results.json"))
 
@@ -243,9 +296,7 @@ if failed:
     def test_timeout_buffer(self):
         """Verify as_completed uses timeout + 120s buffer."""
         # Read the source code and verify the timeout buffer
-        script_path = SCRIPT_DIR / "deep_research.py"
-        with open(script_path) as f:
-            content = f.read()
+        content = _read_source("deep_research.py")
 
         # Look for the as_completed call with timeout buffer
         self.assertIn("as_completed(futures, timeout=args.timeout + 120)", content)
@@ -306,31 +357,43 @@ if failed:
         self.assertIn("after 25.5s", warning)
 
     def test_gemini_terminal_states(self):
-        """Verify Gemini handles cancelled/CANCELLED as terminal states."""
+        """Verify Gemini handles cancelled in any casing as a terminal state."""
+        from lib import gemini_dr
+
+        # Terminal checks compare the lowercased status against frozensets
+        for status in ("cancelled", "CANCELLED", "Cancelled"):
+            self.assertIn(status.lower(), gemini_dr._CANCELLED)
+        self.assertIn(gemini_dr._interaction_status({"metadata": {"status": "COMPLETED"}}).lower(),
+                      gemini_dr._COMPLETED)
+
         # Read gemini_dr.py source and verify terminal state handling
-        gemini_path = SCRIPT_DIR / "lib" / "gemini_dr.py"
-        with open(gemini_path) as f:
-            content = f.read()
+        content = _read_source("lib/gemini_dr.py")
 
-        # Verify both cancelled and CANCELLED appear in terminal state check
-        self.assertIn('status in ("cancelled", "CANCELLED")', content)
+        self.assertIn("status_key in _CANCELLED", content)
         # Verify it raises ProviderAPIError with "was cancelled" message
         self.assertIn('raise ProviderAPIError("gemini", 0, "was cancelled"', content)
 
     def test_openai_terminal_states(self):
         """Verify OpenAI handles incomplete and cancelled as terminal states."""
-        # Read openai_dr.py source and verify terminal state handling
-        openai_path = SCRIPT_DIR / "lib" / "openai_dr.py"
-        with open(openai_path) as f:
-            content = f.read()
-
-        # Verify incomplete terminal state
-        self.assertIn('status == "incomplete"', content)
-        self.assertIn('raise ProviderAPIError("openai", 0, "returned incomplete', content)
-
-        # Verify cancelled terminal state
-        self.assertIn('status == "cancelled"', content)
-        self.assertIn('raise ProviderAPIError("openai", 0, "was cancelled"', content)
+        from unittest import mock
+        from lib import openai_dr
+        from lib.errors import ProviderAPIError
+
+        self.assertIn("completed", openai_dr._TERMINAL_OK)
+        cases = {
+            "incomplete": "returned incomplete",
+            "cancelled": "was cancelled",
+            "failed": "quota exceeded",
+        }
+        for status, expected in cases.items():
+            resp = {"status": status, "error": {"message": "quota exceeded"}}
+            with self.subTest(status=status), \
+                    mock.patch.object(openai_dr.http, "get_if_changed", return_value=(resp, None)), \
+                    mock.patch.object(openai_dr.time, "sleep") as sleep:
+                with self.assertRaises(ProviderAPIError) as ctx:
+                    openai_dr._poll_response("key", "resp_1")
+                self.assertIn(expected, str(ctx.exception))
+                sleep.assert_not_called()
 
     def test_openai_adaptive_intervals(self):
         """Test OpenAI adaptive poll interval function."""
@@ -351,20 +414,39 @@ if failed:
         self.assertEqual(_get_poll_interval(600), 30)
         self.assertEqual(_get_poll_interval(1200), 30)
 
+    def test_openai_backoff_after_ten_minutes(self):
+        """Past 600s, poll intervals grow geometrically up to the cap."""
+        from lib import openai_dr
+
+        self.assertEqual(openai_dr._next_poll_interval(60, 5.0), 5)
+        self.assertEqual(openai_dr._next_poll_interval(700, None), 30)
+        self.assertAlmostEqual(openai_dr._next_poll_interval(700, 30.0), 39.0)
+        self.assertEqual(openai_dr._next_poll_interval(1500, 55.0), openai_dr.POLL_MAX_INTERVAL)
+
+    def test_openai_not_modified_keeps_polling(self):
+        """A 304 poll reuses the last status and resends the ETag."""
+        from unittest import mock
+        from lib import openai_dr
+
+        polls = [({"status": "in_progress"}, '"v1"'), (None, '"v1"'),
+                 ({"status": "completed", "id": "r"}, '"v2"')]
+        with mock.patch.object(openai_dr.http, "get_if_changed", side_effect=polls) as get, \
+                mock.patch.object(openai_dr.time, "sleep") as sleep:
+            resp = openai_dr._poll_response("key", "resp_1")
+        self.assertEqual(resp["id"], "r")
+        self.assertEqual([c.kwargs["etag"] for c in get.call_args_list], [None, '"v1"', '"v1"'])
+        self.assertEqual(sleep.call_count, 2)
+
     def test_timeout_ceilings(self):
         """Verify timeout ceilings are >= 1800s (30 min) for both providers."""
         # Read gemini_dr.py and verify timeout ceiling
-        gemini_path = SCRIPT_DIR / "lib" / "gemini_dr.py"
-        with open(gemini_path) as f:
-            gemini_content = f.read()
+        gemini_content = _read_source("lib/gemini_dr.py")
 
         # Gemini now uses MAX_TIMEOUT_SECONDS like OpenAI (for Phase 3)
         self.assertIn("MAX_TIMEOUT_SECONDS = 1800", gemini_content)
 
         # Read openai_dr.py and verify timeout ceiling
-        openai_path = SCRIPT_DIR / "lib" / "openai_dr.py"
-        with open(openai_path) as f:
-            openai_content = f.read()
+        openai_content = _read_source("lib/openai_dr.py")
 
         # OpenAI uses MAX_POLL_SECONDS
         self.assertIn("MAX_POLL_SECONDS = 1800", openai_content)